@@ -144,21 +144,18 @@ class Canvas(QWidget):
         """Increases the zoom factor."""
         if self._state:
             # You might want to define max zoom in your state or preferences
-            self._state.zoom_factor = min(2.5, self._state.zoom_factor * 1.25)
-            self.recalculate_fixed_size()
+            self._set_zoom_factor(min(2.5, self._state.zoom_factor * 1.25))
 
     def zoom_out(self):
         """Decreases the zoom factor."""
         if self._state:
             # You might want to define min zoom in your state or preferences
-            self._state.zoom_factor = max(0.25, self._state.zoom_factor / 1.25)
-            self.recalculate_fixed_size()
+            self._set_zoom_factor(max(0.25, self._state.zoom_factor / 1.25))
 
     def zoom_reset(self):
         """Resets the zoom factor to 1."""
         if self._state:
-            self._state.zoom_factor = 1
-            self.recalculate_fixed_size()
+            self._set_zoom_factor(1)
 
     def zoom_fit(self):
         """Fits the canvas zoom to the parent viewport size."""
@@ -207,7 +204,20 @@ class Canvas(QWidget):
         target_zoom = min(ratio_w, ratio_h)
 
         # Clamp the zoom factor to reasonable limits (e.g., between 0.1 and 4.0)
-        self._state.zoom_factor = max(0.1, min(4.0, target_zoom))
+        self._set_zoom_factor(max(0.1, min(4.0, target_zoom)))
+
+    def _set_zoom_factor(self, zoom_factor: float):
+        """
+        Sets the zoom factor of the state and resizes the canvas accordingly.
+
+        Does nothing if the zoom factor did not change, e.g. when zooming in at the maximum zoom.
+
+        Args:
+            zoom_factor: The new zoom factor.
+        """
+        if self._state.zoom_factor == zoom_factor:
+            return
+        self._state.zoom_factor = zoom_factor
         self.recalculate_fixed_size()
 
     def _paint_to_qimage(
@@ -746,9 +756,10 @@ class Canvas(QWidget):
         )
         threshold_mm = 8 / scale
 
-        snap_grid = get_global_preferences().get_snap_to_grid()
-        snap_hoop = get_global_preferences().get_snap_to_hoop()
-        snap_layers = get_global_preferences().get_snap_to_layers()
+        prefs = get_global_preferences()
+        snap_grid = prefs.get_snap_to_grid()
+        snap_hoop = prefs.get_snap_to_hoop()
+        snap_layers = prefs.get_snap_to_layers()
 
         best_dx = None
         best_dy = None
@@ -770,7 +781,7 @@ class Canvas(QWidget):
                     snap_y_val = target_val
 
         if snap_grid:
-            grid_size = get_global_preferences().get_grid_size_mm()
+            grid_size = prefs.get_grid_size_mm()
             near_x = round(pt.x() / grid_size) * grid_size
             update_dx(near_x - pt.x(), near_x)
             near_y = round(pt.y() / grid_size) * grid_size
@@ -815,9 +826,10 @@ class Canvas(QWidget):
         scale = self._state.zoom_factor * DEFAULT_SCALE_FACTOR
         threshold_mm = 8 / scale
 
-        snap_grid = get_global_preferences().get_snap_to_grid()
-        snap_hoop = get_global_preferences().get_snap_to_hoop()
-        snap_layers = get_global_preferences().get_snap_to_layers()
+        prefs = get_global_preferences()
+        snap_grid = prefs.get_snap_to_grid()
+        snap_hoop = prefs.get_snap_to_hoop()
+        snap_layers = prefs.get_snap_to_layers()
 
         if not (snap_grid or snap_hoop or snap_layers):
             return candidate_pos
@@ -862,7 +874,7 @@ class Canvas(QWidget):
                     snap_y_val = target_val
 
         if snap_grid:
-            grid_size = get_global_preferences().get_grid_size_mm()
+            grid_size = prefs.get_grid_size_mm()
             for pt in candidate_pts:
                 near_x = round(pt.x() / grid_size) * grid_size
                 update_dx(near_x - pt.x(), near_x)
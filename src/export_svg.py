@@ -216,9 +216,8 @@ class ExportToSvg:
                     '">\n'
                 )
 
-                for partition_key in partitions:
+                for partition in partitions.values():
                     # Each partition is a list of list. Each list is a connected graph.
-                    partition = partitions[partition_key]
                     route = partition.route
                     color = partition.color
                     part_id = f"partition_{layer_idx}_{partition.name}"
@@ -174,12 +174,18 @@ def text_to_qimage(text: str, font_path: str, color_name: str) -> Optional[QImag
     return image
 
 
+# Rendered icons, keyed by (svg_path, size). The same icons are requested by every
+# dialog instance, so they are rendered only once.
+_svg_icon_cache: dict[tuple[str, int], QIcon] = {}
+
+
 def create_icon_from_svg(svg_path: str, size: int = 32) -> QIcon | None:
     """
     Creates a QIcon from an SVG resource file.
 
     Renders an SVG file to a QPixmap and then creates a QIcon from it. This
-    is useful for creating resolution-independent icons.
+    is useful for creating resolution-independent icons. Icons are cached, so
+    rendering happens only the first time a (svg_path, size) pair is requested.
 
     Args:
         svg_path: The path to the SVG file (can be a Qt resource path).
@@ -188,6 +194,46 @@ def create_icon_from_svg(svg_path: str, size: int = 32) -> QIcon | None:
     Returns:
         A QIcon object, or None if the SVG file is invalid or cannot be loaded.
     """
+    key = (svg_path, size)
+    icon = _svg_icon_cache.get(key)
+    if icon is None:
+        icon = _render_icon_from_svg(svg_path, size)
+        if icon is not None:
+            _svg_icon_cache[key] = icon
+    return icon
+
+
+# Theme icons, keyed by name. QIcon.fromTheme() may probe the icon theme inheritance chain
+# on disk for every call.
+_theme_icon_cache: dict[str, QIcon] = {}
+
+
+def create_icon_from_theme(name: str) -> QIcon:
+    """
+    Returns the icon with the given name from the current icon theme.
+
+    Same as QIcon.fromTheme(), but the lookup happens only the first time a name is requested.
+    If the theme has no such icon, e.g. on Windows and macOS, the bundled
+    ":/icons/svg/actions/<name>-symbolic.svg" is used instead, if there is one.
+
+    Args:
+        name: The freedesktop.org icon name, like "document-open".
+
+    Returns:
+        The QIcon. It is null if neither the theme nor the resources have an icon with that name.
+    """
+    icon = _theme_icon_cache.get(name)
+    if icon is None:
+        icon = QIcon.fromTheme(name)
+        if icon.isNull():
+            fallback = f":/icons/svg/actions/{name}-symbolic.svg"
+            if QFile.exists(fallback):
+                icon = QIcon(fallback)
+        _theme_icon_cache[name] = icon
+    return icon
+
+
+def _render_icon_from_svg(svg_path: str, size: int) -> QIcon | None:
     renderer = QSvgRenderer(svg_path)
     if not renderer.isValid():
         logger.error(f"Error: Invalid SVG resource: {svg_path}")
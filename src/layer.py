@@ -31,7 +31,7 @@ class LayerAlign(IntEnum):
     VERTICAL_BOTTOM = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbroideryParameters:
     pull_compensation_mm: float = 0.0
     max_stitch_length_mm: float = 1000.0
@@ -42,7 +42,7 @@ class EmbroideryParameters:
     fill_underlay: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerProperties:
     """Mutable properties only. Immutables, like UUID, should not be here."""
 
@@ -101,13 +101,15 @@ class Layer:
             # FIXME: Should be cleaner code.
             # Clean possible old partitions created from constructor.
             self._partitions = {}
+            # name -> key, to drop duplicated names without scanning the partitions each time.
+            keys_by_name = {}
             for k, v in d["partitions"].items():
                 part = Partition.from_dict(v)
-                for kk, vv in self._partitions.items():
-                    if part.name == vv.name:
-                        del self._partitions[kk]
-                        break
+                old_key = keys_by_name.get(part.name)
+                if old_key is not None:
+                    del self._partitions[old_key]
                 self._partitions[k] = part
+                keys_by_name[part.name] = k
         if "selected_partition_uuid" in d:
             self._selected_partition_uuid = d["selected_partition_uuid"]
         if "uuid" in d:
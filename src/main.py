@@ -4,6 +4,7 @@
 
 import argparse
 import logging
+import os
 import sys
 
 from PySide6.QtCore import QLibraryInfo, QLocale, QTranslator
@@ -31,6 +32,12 @@ def main():
     parser.add_argument("--mcp-port", type=int, default=8123, help="MCP Server Port")
     args = parser.parse_args()
 
+    if sys.platform.startswith("linux"):
+        # Prefer the desktop's native file dialogs (through the XDG portal) over the
+        # Qt widget-based ones, which can take seconds to open. Must be set before the
+        # QApplication is created. An explicit user setting takes precedence.
+        os.environ.setdefault("QT_QPA_PLATFORMTHEME", "xdgdesktopportal")
+
     app = QApplication(sys.argv)
 
     # System translations
@@ -10,15 +10,28 @@ canvas widget. It also handles all the user interactions and connects them to th
 application's state.
 """
 
+import dataclasses
+import functools
 import logging
 import os.path
 import sys
-from collections.abc import Iterable
 from concurrent.futures import Future
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
 from coloraide import Color
-from PySide6.QtCore import QObject, QPointF, QRunnable, QSize, Qt, Signal, Slot
+from PySide6.QtCore import (
+    QT_TR_NOOP,
+    QModelIndex,
+    QObject,
+    QPointF,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import (
     QAction,
     QCloseEvent,
@@ -57,18 +70,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from about_dialog import AboutDialog
 from canvas import Canvas
 from deselectable_list_widget import DeselectableListWidget
 from document import Document
-from font_dialog import FontDialog
-from image_utils import create_icon_from_svg
+from image_utils import create_icon_from_svg, create_icon_from_theme
 from layer import EmbroideryParameters, ImageLayer, Layer, LayerAlign, LayerProperties, TextLayer
 from partition import Partition
-from partition_dialog import PartitionDialog
-from pixel_editor_dialog import PixelEditorDialog
-from preference_dialog import PreferenceDialog
-from preferences import get_global_preferences
+from preferences import Preferences, get_global_preferences
 from state import State
 from state_properties import StateProperties, StatePropertyFlags
 
@@ -76,9 +84,50 @@ logger = logging.getLogger(__name__)
 
 ICON_SIZE = 22
 
-# FIXME: Move to a better place
-# Matches "100%", which is the default zoom factor in a new state
-DEFAULT_ZOOM_FACTOR_IDX = 3
+# Native dialogs are used when available (DontUseNativeDialog is not set). Custom directory
+# icons are skipped, since fetching them is slow on some platforms.
+FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# (fill method, text) for the "Fill Method" combo box, in display order.
+FILL_METHODS = (
+    ("auto_fill", QT_TR_NOOP("Auto Fill")),
+    ("circular_fill", QT_TR_NOOP("Circular Fill")),
+    ("contour_fill", QT_TR_NOOP("Contour Fill")),
+    ("legacy_fill", QT_TR_NOOP("Legacy Fill")),
+)
+# fill method -> row in the "Fill Method" combo box
+FILL_METHOD_INDEXES = {fill_method: i for i, (fill_method, _) in enumerate(FILL_METHODS)}
+
+# (align, text, icon) for the "Layer" menu align actions. Texts are translated when the actions
+# are created.
+ALIGN_ACTIONS = (
+    (
+        LayerAlign.HORIZONTAL_LEFT,
+        QT_TR_NOOP("Align Horizontal Left"),
+        "align-horizontal-left-symbolic.svg",
+    ),
+    (
+        LayerAlign.HORIZONTAL_CENTER,
+        QT_TR_NOOP("Align Horizontal Center"),
+        "align-horizontal-center-symbolic.svg",
+    ),
+    (
+        LayerAlign.HORIZONTAL_RIGHT,
+        QT_TR_NOOP("Align Horizontal Right"),
+        "align-horizontal-right-symbolic.svg",
+    ),
+    (LayerAlign.VERTICAL_TOP, QT_TR_NOOP("Align Vertical Top"), "align-vertical-top-symbolic.svg"),
+    (
+        LayerAlign.VERTICAL_CENTER,
+        QT_TR_NOOP("Align Vertical Center"),
+        "align-vertical-center-symbolic.svg",
+    ),
+    (
+        LayerAlign.VERTICAL_BOTTOM,
+        QT_TR_NOOP("Align Vertical Bottom"),
+        "align-vertical-bottom-symbolic.svg",
+    ),
+)
 
 
 @contextmanager
@@ -87,24 +136,55 @@ def block_signals(objs: QObject | tuple[QObject]):
     Context manager to temporarily block signals for QObjects.
 
     This is useful to avoid triggering slots when updating widget values programmatically,
-    preventing circular updates or unnecessary processing.
+    preventing circular updates or unnecessary processing. It uses QSignalBlocker, so the
+    previous blocked state of each object is restored on exit, which makes nesting safe.
 
     Args:
         objs: A single QObject or an iterable of QObjects for which signals should be blocked.
     """
+    # A concrete type check: much cheaper than testing against the Iterable ABC
+    if isinstance(objs, QObject):
+        objs = (objs,)
+    with ExitStack() as stack:
+        for obj in objs:
+            stack.enter_context(QSignalBlocker(obj))
+        yield
+
+
+@contextmanager
+def updates_disabled(widgets: QWidget | tuple[QWidget]):
+    """
+    Context manager to temporarily disable updates (repaints) for QWidgets.
+
+    Useful when adding or removing many items, so the widget is repainted once at the end.
+
+    Args:
+        widgets: A single QWidget or an iterable of QWidgets.
+    """
+    if isinstance(widgets, QWidget):
+        widgets = (widgets,)
+    previous = [widget.updatesEnabled() for widget in widgets]
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
     try:
-        if isinstance(objs, Iterable):
-            for obj in objs:
-                obj.blockSignals(True)
-        else:
-            objs.blockSignals(True)
         yield
     finally:
-        if isinstance(objs, Iterable):
-            for obj in objs:
-                obj.blockSignals(False)
-        else:
-            objs.blockSignals(False)
+        for widget, enabled in zip(widgets, previous):
+            widget.setUpdatesEnabled(enabled)
+
+
+def set_value_if_changed(widget: QWidget, value) -> None:
+    """
+    Calls widget.setValue(value) only when the value is different from the current one.
+
+    Avoids the needless relayout/repaint of spin boxes and sliders when a layer is re-selected.
+
+    Args:
+        widget: A QSpinBox, QDoubleSpinBox or QSlider.
+        value: The new value.
+    """
+    if widget.value() != value:
+        widget.setValue(value)
 
 
 class MainWindow(QMainWindow):
@@ -123,7 +203,48 @@ class MainWindow(QMainWindow):
         self._undo_group = QUndoGroup(self)
         self._connected_doc = None
         self._active_workers = set()
+        # Projects being saved in the thread pool. "Save" is disabled for them until it finishes.
+        self._saving_states: set[State] = set()
         self._last_stack_indexes = {}
+        self._suppress_property_slots = False
+        # File dialog filters. Translators are installed before the window is created, and the
+        # language can't be changed at runtime: translate them only once.
+        self._open_file_filter = self.tr(
+            "All Supported Files (*.pixemproj *.png *.jpg *.bmp );;Pixem project (*.pixemproj);;All files (*)"
+        )
+        self._project_file_filter = self.tr("Pixem files (*.pixemproj);;All files (*)")
+        self._image_file_filter = self.tr("Images (*.png *.jpg *.bmp);;All files (*)")
+        self._svg_file_filter = self.tr("SVG (*.svg);;All files (*)")
+        self._png_file_filter = self.tr("PNG (*.png);;All files (*)")
+        # Copy of the layer properties last shown in the property editor
+        self._last_properties_shown: LayerProperties | None = None
+        # Partition UUIDs, in the same order as the rows in the partition list
+        self._partition_keys: list[str] = []
+        # The partition list is not populated while its dock is hidden. True if it is out of date.
+        self._partition_list_dirty = False
+        # Whether there was a project the last time _update_qactions() ran
+        self._last_qactions_enabled: bool | None = None
+        # (can save, layer selected, image layer selected) the last time _update_qactions() ran
+        self._last_layer_actions_state: tuple[bool, bool, bool] | None = None
+        # The "Recent Files" menu is only rebuilt when it is about to be shown
+        self._recent_menu_dirty = True
+        # Files shown in the "Recent Files" menu, in order. None if not populated yet.
+        self._recent_menu_files: tuple[str, ...] | None = None
+        # Canvases waiting for _relayout_canvases(), which runs once per event loop iteration
+        self._canvases_to_relayout: set[Canvas] = set()
+        # Whether _update_qactions() is already scheduled to run in the next event loop iteration
+        self._qactions_update_scheduled = False
+        # (colors, partitions, pixels) shown in the status bar. None if not shown yet.
+        self._statusbar_stats: tuple[int, int, int] | None = None
+        # Whether _update_statusbar() is already scheduled to run in the next event loop iteration
+        self._statusbar_update_scheduled = False
+        # Coalesces the valueChanged storms of sliders and spin boxes into a single update.
+        # (state, layer) that the pending update applies to.
+        self._pending_property_target = None
+        self._property_update_timer = QTimer(self)
+        self._property_update_timer.setSingleShot(True)
+        self._property_update_timer.setInterval(16)
+        self._property_update_timer.timeout.connect(self._flush_property_update)
         self._setup_ui()
 
         self._save_default_settings()
@@ -131,25 +252,37 @@ class MainWindow(QMainWindow):
 
         if filename:
             self.open_file(filename)
-        else:
-            open_on_startup = get_global_preferences().get_open_file_on_startup()
-            if open_on_startup:
-                # Try to open "open files" from previous session
-                files = get_global_preferences().get_open_files()
-
-                for f in files:
-                    if os.path.exists(f):
-                        self._open_filename(f)
-
-                # Restore active file
-                active_file = get_global_preferences().get_active_file()
-                if active_file:
-                    for i in range(self._tab_widget.count()):
-                        doc = self._tab_widget.widget(i)
-                        if isinstance(doc, Document) and doc.state.project_filename == active_file:
-                            self._tab_widget.setCurrentIndex(i)
-                            break
+        elif get_global_preferences().get_open_file_on_startup():
+            # Loading projects can be slow. Do it once the window is visible.
+            QTimer.singleShot(0, self._deferred_startup_open)
+
+        self._update_window_title()
+
+    @Slot()
+    def _deferred_startup_open(self):
+        """Opens the files that were open in the previous session, and restores the active one."""
+        prefs = get_global_preferences()
+        files = prefs.get_open_files()
+        count = self._tab_widget.count()
+
+        # Every opened file becomes the current tab. Don't refresh the docks, actions and
+        # status bar for each of them: only for the one that ends up being current.
+        with block_signals(self._tab_widget):
+            for f in files:
+                if os.path.exists(f):
+                    self._open_filename(f)
+
+            # Restore active file
+            active_file = prefs.get_active_file()
+            if active_file:
+                for i in range(self._tab_widget.count()):
+                    doc = self._tab_widget.widget(i)
+                    if isinstance(doc, Document) and doc.state.project_filename == active_file:
+                        self._tab_widget.setCurrentIndex(i)
+                        break
 
+        if self._tab_widget.count() != count:
+            self._on_current_document_changed(self._tab_widget.currentIndex())
         self._update_window_title()
 
     def _setup_ui(self):
@@ -178,6 +311,27 @@ class MainWindow(QMainWindow):
         )
 
         self._setup_statusbar()
+
+        # Actions that are only enabled while there is a project
+        self._project_actions = (
+            self._close_action,
+            self._export_action,
+            self._export_as_action,
+            self._export_to_png_as_action,
+            self._add_text_layer_action,
+            self._add_image_layer_action,
+            self._delete_layer_action,
+            self._duplicate_layer_action,
+            self._fit_to_hoop_action,
+            self._edit_partition_action,
+            self._zoom_in_action,
+            self._zoom_out_action,
+            self._zoom_reset_action,
+            self._zoom_fit_action,
+            *self._align_actions.values(),
+            self._reorder_partitions_action,
+            self._delete_partition_action,
+        )
         self._update_qactions()
 
     def _setup_menu(self):
@@ -186,301 +340,358 @@ class MainWindow(QMainWindow):
         file_menu = QMenu(self.tr("&File"), self)
         menu_bar.addMenu(file_menu)
 
-        self._new_action = QAction(QIcon.fromTheme("document-new"), self.tr("New Project"), self)
-        self._new_action.setShortcut(QKeySequence("Ctrl+N"))
-        self._new_action.triggered.connect(self._on_new_project)
-        file_menu.addAction(self._new_action)
-
-        self._open_action = QAction(
-            QIcon.fromTheme("document-open"), self.tr("Open Image or Project"), self
+        self._new_action = self._create_action(
+            file_menu,
+            self.tr("New Project"),
+            self._on_new_project,
+            create_icon_from_theme("document-new"),
+            "Ctrl+N",
+        )
+        self._open_action = self._create_action(
+            file_menu,
+            self.tr("Open Image or Project"),
+            self._on_file_open,
+            create_icon_from_theme("document-open"),
+            "Ctrl+O",
         )
-        self._open_action.setShortcut(QKeySequence("Ctrl+O"))
-        self._open_action.triggered.connect(self._on_file_open)
-        file_menu.addAction(self._open_action)
 
         self._recent_menu = QMenu(self.tr("Recent Files"), file_menu)
         file_menu.addMenu(self._recent_menu)
-        self._populate_recent_menu()
-
-        self._close_action = QAction(
-            QIcon.fromTheme("window-close"), self.tr("Close Project"), self
+        # Fixed pool of actions, one per slot. Populating the menu only updates them.
+        self._recent_actions = []
+        for _ in range(Preferences.MAX_RECENT_FILES):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(self._on_recent_file)
+            self._recent_menu.addAction(action)
+            self._recent_actions.append(action)
+        self._recent_menu.addSeparator()
+        self._clear_recent_action = self._create_action(
+            self._recent_menu,
+            self.tr("Clear Menu"),
+            self._on_clear_recent_files,
+            create_icon_from_theme("edit-clear"),
+        )
+        self._recent_menu.aboutToShow.connect(self._on_recent_menu_about_to_show)
+        self._invalidate_recent_menu()
+
+        self._close_action = self._create_action(
+            file_menu,
+            self.tr("Close Project"),
+            self._on_close_project,
+            create_icon_from_theme("window-close"),
+            "Ctrl+W",
         )
-        self._close_action.setShortcut(QKeySequence("Ctrl+W"))
-        self._close_action.triggered.connect(self._on_close_project)
-        file_menu.addAction(self._close_action)
 
         file_menu.addSeparator()
 
-        self._save_action = QAction(QIcon.fromTheme("document-save"), self.tr("Save Project"), self)
-        self._save_action.setShortcut(QKeySequence("Ctrl+S"))
-        self._save_action.triggered.connect(self._on_save_project)
-        file_menu.addAction(self._save_action)
-
-        self._save_as_action = QAction(
-            QIcon.fromTheme("document-save-as"), self.tr("Save Project As..."), self
+        self._save_action = self._create_action(
+            file_menu,
+            self.tr("Save Project"),
+            self._on_save_project,
+            create_icon_from_theme("document-save"),
+            "Ctrl+S",
+        )
+        self._save_as_action = self._create_action(
+            file_menu,
+            self.tr("Save Project As..."),
+            self._on_save_project_as,
+            create_icon_from_theme("document-save-as"),
+            "Ctrl+Shift+S",
         )
-        self._save_as_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        self._save_as_action.triggered.connect(self._on_save_project_as)
-        file_menu.addAction(self._save_as_action)
 
         file_menu.addSeparator()
 
-        self._export_action = QAction(self.tr("Export Project"), self)
-        self._export_action.setShortcut(QKeySequence("Ctrl+E"))
-        self._export_action.triggered.connect(self._on_export_project)
-        file_menu.addAction(self._export_action)
-
-        self._export_as_action = QAction(self.tr("Export Project As..."), self)
-        self._export_as_action.setShortcut(QKeySequence("Ctrl+Shift+E"))
-        self._export_as_action.triggered.connect(self._on_export_project_as)
-        file_menu.addAction(self._export_as_action)
-
-        self._export_to_png_as_action = QAction(self.tr("Export to PNG As..."), self)
-        self._export_to_png_as_action.triggered.connect(self._on_export_to_png_as)
-        file_menu.addAction(self._export_to_png_as_action)
+        self._export_action = self._create_action(
+            file_menu, self.tr("Export Project"), self._on_export_project, shortcut="Ctrl+E"
+        )
+        self._export_as_action = self._create_action(
+            file_menu,
+            self.tr("Export Project As..."),
+            self._on_export_project_as,
+            shortcut="Ctrl+Shift+E",
+        )
+        self._export_to_png_as_action = self._create_action(
+            file_menu, self.tr("Export to PNG As..."), self._on_export_to_png_as
+        )
 
         file_menu.addSeparator()
 
-        self._exit_action = QAction(QIcon.fromTheme("application-exit"), self.tr("Exit"), self)
-        self._exit_action.setShortcut(QKeySequence("Ctrl+Q"))
-        self._exit_action.triggered.connect(self._on_exit_application)
-        file_menu.addAction(self._exit_action)
+        self._exit_action = self._create_action(
+            file_menu,
+            self.tr("Exit"),
+            self._on_exit_application,
+            create_icon_from_theme("application-exit"),
+            "Ctrl+Q",
+        )
 
         edit_menu = QMenu(self.tr("&Edit"), self)
         menu_bar.addMenu(edit_menu)
 
         self._undo_action = self._undo_group.createUndoAction(self, self.tr("&Undo"))
         self._undo_action.setShortcut("Ctrl+Z")
-        self._undo_action.setIcon(QIcon.fromTheme("edit-undo"))
+        self._undo_action.setIcon(create_icon_from_theme("edit-undo"))
         edit_menu.addAction(self._undo_action)
 
         self._redo_action = self._undo_group.createRedoAction(self, self.tr("&Redo"))
         self._redo_action.setShortcut("Ctrl+Shift+Z")
-        self._redo_action.setIcon(QIcon.fromTheme("edit-redo"))
+        self._redo_action.setIcon(create_icon_from_theme("edit-redo"))
         edit_menu.addAction(self._redo_action)
 
         edit_menu.addSeparator()
 
-        icon = create_icon_from_svg(":/icons/svg/actions/object-select-symbolic.svg")
-        self._canvas_mode_move_action = QAction(icon, self.tr("Select Mode"), self)
-        self._canvas_mode_move_action.setCheckable(True)
+        self._canvas_mode_move_action = self._create_action(
+            edit_menu,
+            self.tr("Select Mode"),
+            self._on_canvas_mode_move,
+            create_icon_from_svg(":/icons/svg/actions/object-select-symbolic.svg"),
+            checkable=True,
+        )
         self._canvas_mode_move_action.setChecked(True)
-        self._canvas_mode_move_action.triggered.connect(self._on_canvas_mode_move)
-        edit_menu.addAction(self._canvas_mode_move_action)
 
-        icon = create_icon_from_svg(":/icons/svg/actions/draw-freehand-symbolic.svg")
-        self._edit_layer_pixels_action = QAction(icon, self.tr("Edit Layer Pixels"), self)
-        self._edit_layer_pixels_action.triggered.connect(self._on_edit_layer_pixels)
+        # Added to the "Layer" menu below
+        self._edit_layer_pixels_action = self._create_action(
+            None,
+            self.tr("Edit Layer Pixels"),
+            self._on_edit_layer_pixels,
+            create_icon_from_svg(":/icons/svg/actions/draw-freehand-symbolic.svg"),
+        )
 
         edit_menu.addSeparator()
 
-        self._preferences_action = QAction(
-            QIcon.fromTheme("preferences-system"), self.tr("&Preferences"), self
+        self._preferences_action = self._create_action(
+            edit_menu,
+            self.tr("&Preferences"),
+            self._on_preferences,
+            create_icon_from_theme("preferences-system"),
         )
-        self._preferences_action.triggered.connect(self._on_preferences)
-        edit_menu.addAction(self._preferences_action)
-
-        self._document_properties_action = QAction(
-            QIcon.fromTheme("document-properties"), self.tr("&Document Properties"), self
+        self._document_properties_action = self._create_action(
+            edit_menu,
+            self.tr("&Document Properties"),
+            self._on_document_properties,
+            create_icon_from_theme("document-properties"),
+            "Ctrl+Shift+D",
         )
-        self._document_properties_action.setShortcut(QKeySequence("Ctrl+Shift+D"))
-        self._document_properties_action.triggered.connect(self._on_document_properties)
-        edit_menu.addAction(self._document_properties_action)
 
         self._view_menu = QMenu("&View", self)
         menu_bar.addMenu(self._view_menu)
-        self._zoom_in_action = QAction(QIcon.fromTheme("zoom-in"), self.tr("Zoom In"), self)
-        self._zoom_in_action.setShortcut(QKeySequence.StandardKey.ZoomIn)  # Ctrl++
-        self._zoom_in_action.triggered.connect(self._on_zoom_in)
-        self._view_menu.addAction(self._zoom_in_action)
-
-        self._zoom_out_action = QAction(QIcon.fromTheme("zoom-out"), self.tr("Zoom Out"), self)
-        self._zoom_out_action.setShortcut(QKeySequence.StandardKey.ZoomOut)  # Ctrl+-
-        self._zoom_out_action.triggered.connect(self._on_zoom_out)
-        self._view_menu.addAction(self._zoom_out_action)
-
-        self._zoom_reset_action = QAction(
-            QIcon.fromTheme("zoom-original"), self.tr("Reset Zoom (1:1)"), self
+        self._zoom_in_action = self._create_action(
+            self._view_menu,
+            self.tr("Zoom In"),
+            self._on_zoom_in,
+            create_icon_from_theme("zoom-in"),
+            QKeySequence.StandardKey.ZoomIn,  # Ctrl++
         )
-        self._zoom_reset_action.setShortcut(QKeySequence("Ctrl+0"))
-        self._zoom_reset_action.triggered.connect(self._on_zoom_reset)
-        self._view_menu.addAction(self._zoom_reset_action)
-
-        self._zoom_fit_action = QAction(
-            QIcon.fromTheme("zoom-fit-best"), self.tr("Zoom to Fit"), self
+        self._zoom_out_action = self._create_action(
+            self._view_menu,
+            self.tr("Zoom Out"),
+            self._on_zoom_out,
+            create_icon_from_theme("zoom-out"),
+            QKeySequence.StandardKey.ZoomOut,  # Ctrl+-
+        )
+        self._zoom_reset_action = self._create_action(
+            self._view_menu,
+            self.tr("Reset Zoom (1:1)"),
+            self._on_zoom_reset,
+            create_icon_from_theme("zoom-original"),
+            "Ctrl+0",
+        )
+        self._zoom_fit_action = self._create_action(
+            self._view_menu,
+            self.tr("Zoom to Fit"),
+            self._on_zoom_fit,
+            create_icon_from_theme("zoom-fit-best"),
+            "Ctrl+9",
         )
-        self._zoom_fit_action.setShortcut(QKeySequence("Ctrl+9"))
-        self._zoom_fit_action.triggered.connect(self._on_zoom_fit)
-        self._view_menu.addAction(self._zoom_fit_action)
 
         self._view_menu.addSeparator()
         # The rest of the "View" actions are added once the docks are finished
 
         self._show_hoop_separator_action = self._view_menu.addSeparator()
 
-        self._show_hoop_action = QAction(self.tr("&Show hoop size"), self)
-        self._show_hoop_action.setCheckable(True)
-        self._show_hoop_action.triggered.connect(
-            lambda: self._on_show_hoop_size(self._show_hoop_action)
+        prefs = get_global_preferences()
+        self._show_hoop_action = self._create_action(
+            self._view_menu,
+            self.tr("&Show hoop size"),
+            self._on_show_hoop_size,
+            checkable=True,
         )
-        self._view_menu.addAction(self._show_hoop_action)
-        self._show_hoop_action.setChecked(get_global_preferences().get_hoop_visible())
-
-        self._show_grid_action = QAction(QIcon.fromTheme("view-grid"), self.tr("Show &Grid"), self)
-        self._show_grid_action.setCheckable(True)
-        self._show_grid_action.setShortcut(QKeySequence("Ctrl+G"))
-        self._show_grid_action.triggered.connect(self._on_show_grid)
-        self._view_menu.addAction(self._show_grid_action)
-        self._show_grid_action.setChecked(get_global_preferences().get_grid_visible())
+        self._show_hoop_action.setChecked(prefs.get_hoop_visible())
+
+        self._show_grid_action = self._create_action(
+            self._view_menu,
+            self.tr("Show &Grid"),
+            self._on_show_grid,
+            create_icon_from_theme("view-grid"),
+            "Ctrl+G",
+            checkable=True,
+        )
+        self._show_grid_action.setChecked(prefs.get_grid_visible())
 
         # Snapping Submenu
         snapping_menu = QMenu(self.tr("Snapping"), self)
         self._view_menu.addMenu(snapping_menu)
 
-        self._snap_to_grid_action = QAction(self.tr("Snap to Grid"), self)
-        self._snap_to_grid_action.setCheckable(True)
-        self._snap_to_grid_action.triggered.connect(self._on_snap_to_grid)
-        snapping_menu.addAction(self._snap_to_grid_action)
-        self._snap_to_grid_action.setChecked(get_global_preferences().get_snap_to_grid())
+        self._snap_to_grid_action = self._create_action(
+            snapping_menu, self.tr("Snap to Grid"), self._on_snap_to_grid, checkable=True
+        )
+        self._snap_to_grid_action.setChecked(prefs.get_snap_to_grid())
 
-        self._snap_to_hoop_action = QAction(self.tr("Snap to Hoop"), self)
-        self._snap_to_hoop_action.setCheckable(True)
-        self._snap_to_hoop_action.triggered.connect(self._on_snap_to_hoop)
-        snapping_menu.addAction(self._snap_to_hoop_action)
-        self._snap_to_hoop_action.setChecked(get_global_preferences().get_snap_to_hoop())
+        self._snap_to_hoop_action = self._create_action(
+            snapping_menu, self.tr("Snap to Hoop"), self._on_snap_to_hoop, checkable=True
+        )
+        self._snap_to_hoop_action.setChecked(prefs.get_snap_to_hoop())
 
-        self._snap_to_layers_action = QAction(self.tr("Snap to Layers"), self)
-        self._snap_to_layers_action.setCheckable(True)
-        self._snap_to_layers_action.triggered.connect(self._on_snap_to_layers)
-        snapping_menu.addAction(self._snap_to_layers_action)
-        self._snap_to_layers_action.setChecked(get_global_preferences().get_snap_to_layers())
+        self._snap_to_layers_action = self._create_action(
+            snapping_menu, self.tr("Snap to Layers"), self._on_snap_to_layers, checkable=True
+        )
+        self._snap_to_layers_action.setChecked(prefs.get_snap_to_layers())
 
         # Sync UI actions when preferences change externally (e.g. via Preference Dialog)
-        get_global_preferences().grid_visible_changed.connect(self._show_grid_action.setChecked)
-        get_global_preferences().snap_to_grid_changed.connect(self._snap_to_grid_action.setChecked)
-        get_global_preferences().snap_to_hoop_changed.connect(self._snap_to_hoop_action.setChecked)
-        get_global_preferences().snap_to_layers_changed.connect(
-            self._snap_to_layers_action.setChecked
-        )
+        prefs.grid_visible_changed.connect(self._show_grid_action.setChecked)
+        prefs.snap_to_grid_changed.connect(self._snap_to_grid_action.setChecked)
+        prefs.snap_to_hoop_changed.connect(self._snap_to_hoop_action.setChecked)
+        prefs.snap_to_layers_changed.connect(self._snap_to_layers_action.setChecked)
 
         self._view_menu.addSeparator()
 
-        self._reset_layout_action = QAction(self.tr("Reset Layout"), self)
-        self._reset_layout_action.triggered.connect(self._on_reset_layout)
-        self._view_menu.addAction(self._reset_layout_action)
+        self._reset_layout_action = self._create_action(
+            self._view_menu, self.tr("Reset Layout"), self._on_reset_layout
+        )
 
         layer_menu = QMenu(self.tr("&Layer"), self)
         menu_bar.addMenu(layer_menu)
 
-        self._add_image_layer_action = QAction(
-            QIcon.fromTheme("insert-image"), self.tr("Add Image Layer"), self
+        self._add_image_layer_action = self._create_action(
+            layer_menu,
+            self.tr("Add Image Layer"),
+            self._on_layer_add_image,
+            create_icon_from_theme("insert-image"),
+            "Ctrl+I",
         )
-        self._add_image_layer_action.setShortcut(QKeySequence("Ctrl+I"))
-        self._add_image_layer_action.triggered.connect(self._on_layer_add_image)
-        layer_menu.addAction(self._add_image_layer_action)
-
-        self._add_text_layer_action = QAction(
-            QIcon.fromTheme("insert-text"), self.tr("Add Text Layer"), self
+        self._add_text_layer_action = self._create_action(
+            layer_menu,
+            self.tr("Add Text Layer"),
+            self._on_layer_add_text,
+            create_icon_from_theme("insert-text"),
+            "Ctrl+T",
         )
-        self._add_text_layer_action.setShortcut(QKeySequence("Ctrl+T"))
-        self._add_text_layer_action.triggered.connect(self._on_layer_add_text)
-        layer_menu.addAction(self._add_text_layer_action)
-
-        self._duplicate_layer_action = QAction(
-            QIcon.fromTheme("edit-copy"), self.tr("Duplicate Layer"), self
+        self._duplicate_layer_action = self._create_action(
+            layer_menu,
+            self.tr("Duplicate Layer"),
+            self._on_layer_duplicate,
+            create_icon_from_theme("edit-copy"),
+            "Ctrl+D",
         )
-        self._duplicate_layer_action.setShortcut(QKeySequence("Ctrl+D"))
-        self._duplicate_layer_action.triggered.connect(self._on_layer_duplicate)
-        layer_menu.addAction(self._duplicate_layer_action)
-
-        self._delete_layer_action = QAction(
-            QIcon.fromTheme("edit-delete"), self.tr("Delete Layer"), self
+        self._delete_layer_action = self._create_action(
+            layer_menu,
+            self.tr("Delete Layer"),
+            self._on_layer_delete,
+            create_icon_from_theme("edit-delete"),
         )
-        self._delete_layer_action.triggered.connect(self._on_layer_delete)
-        layer_menu.addAction(self._delete_layer_action)
 
         layer_menu.addAction(self._edit_layer_pixels_action)
 
-        self._flip_horizontal_action = QAction(self.tr("Flip Horizontal"), self)
-        self._flip_horizontal_action.triggered.connect(self._on_layer_flip_horizontal)
-        layer_menu.addAction(self._flip_horizontal_action)
-
-        self._flip_vertical_action = QAction(self.tr("Flip Vertical"), self)
-        self._flip_vertical_action.triggered.connect(self._on_layer_flip_vertical)
-        layer_menu.addAction(self._flip_vertical_action)
+        self._flip_horizontal_action = self._create_action(
+            layer_menu, self.tr("Flip Horizontal"), self._on_layer_flip_horizontal
+        )
+        self._flip_vertical_action = self._create_action(
+            layer_menu, self.tr("Flip Vertical"), self._on_layer_flip_vertical
+        )
 
         layer_menu.addSeparator()
-        aligns = [
-            (
-                LayerAlign.HORIZONTAL_LEFT,
-                self.tr("Align Horizontal Left"),
-                "align-horizontal-left-symbolic.svg",
-            ),
-            (
-                LayerAlign.HORIZONTAL_CENTER,
-                self.tr("Align Horizontal Center"),
-                "align-horizontal-center-symbolic.svg",
-            ),
-            (
-                LayerAlign.HORIZONTAL_RIGHT,
-                self.tr("Align Horizontal Right"),
-                "align-horizontal-right-symbolic.svg",
-            ),
-            (LayerAlign.VERTICAL_TOP, "Align Vertical Top", "align-vertical-top-symbolic.svg"),
-            (
-                LayerAlign.VERTICAL_CENTER,
-                self.tr("Align Vertical Center"),
-                "align-vertical-center-symbolic.svg",
-            ),
-            (
-                LayerAlign.VERTICAL_BOTTOM,
-                self.tr("Align Vertical Bottom"),
-                "align-vertical-bottom-symbolic.svg",
-            ),
-        ]
 
         self._align_actions = {}
 
-        for i, align in enumerate(aligns):
-            path = f":/icons/svg/actions/{align[2]}"
-            icon = create_icon_from_svg(path)
-            action = QAction(icon, align[1], self)
-            action.triggered.connect(self._on_layer_align)
-            action.setData(align[0])
-            self._align_actions[align[0]] = action
-            layer_menu.addAction(action)
+        for i, (align, text, icon_name) in enumerate(ALIGN_ACTIONS):
+            icon = create_icon_from_svg(f":/icons/svg/actions/{icon_name}")
+            action = self._create_action(
+                layer_menu, self.tr(text), functools.partial(self._on_layer_align, align), icon
+            )
+            self._align_actions[align] = action
             if i == 2:
                 layer_menu.addSeparator()
 
         layer_menu.addSeparator()
 
-        self._fit_to_hoop_action = QAction(self.tr("Fit to Hoop"), self)
-        self._fit_to_hoop_action.setShortcut(QKeySequence("Ctrl+Shift+H"))
-        self._fit_to_hoop_action.triggered.connect(self._on_layer_fit_to_hoop)
-        layer_menu.addAction(self._fit_to_hoop_action)
+        self._fit_to_hoop_action = self._create_action(
+            layer_menu, self.tr("Fit to Hoop"), self._on_layer_fit_to_hoop, shortcut="Ctrl+Shift+H"
+        )
 
         partition_menu = QMenu(self.tr("&Partition"), self)
         menu_bar.addMenu(partition_menu)
 
-        self._edit_partition_action = QAction(self.tr("Edit Partition"), self)
-        self._edit_partition_action.setShortcut(QKeySequence("Ctrl+P"))
-        self._edit_partition_action.triggered.connect(self._on_partition_edit)
-        partition_menu.addAction(self._edit_partition_action)
-
-        self._reorder_partitions_action = QAction(self.tr("Reorder Partitions"), self)
-        self._reorder_partitions_action.triggered.connect(self._on_partition_reorder)
-        partition_menu.addAction(self._reorder_partitions_action)
-
-        self._delete_partition_action = QAction(self.tr("Delete Partition"), self)
-        self._delete_partition_action.triggered.connect(self._on_partition_delete)
-        partition_menu.addAction(self._delete_partition_action)
+        self._edit_partition_action = self._create_action(
+            partition_menu, self.tr("Edit Partition"), self._on_partition_edit, shortcut="Ctrl+P"
+        )
+        self._reorder_partitions_action = self._create_action(
+            partition_menu, self.tr("Reorder Partitions"), self._on_partition_reorder
+        )
+        self._delete_partition_action = self._create_action(
+            partition_menu, self.tr("Delete Partition"), self._on_partition_delete
+        )
 
         help_menu = QMenu(self.tr("&Help"), self)
         menu_bar.addMenu(help_menu)
 
-        self.about_action = QAction(self.tr("About"), self)
-        self.about_action.triggered.connect(self._on_show_about_dialog)
-        help_menu.addAction(self.about_action)
+        self.about_action = self._create_action(
+            help_menu, self.tr("About"), self._on_show_about_dialog
+        )
+
+    def _create_action(
+        self,
+        menu: QMenu | None,
+        text: str,
+        slot,
+        icon: QIcon | None = None,
+        shortcut: str | QKeySequence.StandardKey | None = None,
+        checkable: bool = False,
+    ) -> QAction:
+        """
+        Creates an action, connects it and adds it to a menu.
+
+        Args:
+            menu: The menu to add the action to, or None to not add it to any menu.
+            text: The (already translated) text of the action.
+            slot: Called when the action is triggered.
+            icon: The icon of the action, if any.
+            shortcut: The key sequence or standard key of the action, if any.
+            checkable: Whether the action is checkable.
+
+        Returns:
+            The new action.
+        """
+        action = QAction(text, self)
+        if icon is not None:
+            action.setIcon(icon)
+        if shortcut is not None:
+            action.setShortcut(QKeySequence(shortcut))
+        action.setCheckable(checkable)
+        action.triggered.connect(slot)
+        if menu is not None:
+            menu.addAction(action)
+        return action
+
+    @staticmethod
+    def _create_spinbox(spinbox_class, minimum, maximum, slot):
+        """
+        Creates a spin box for the property editors and connects its valueChanged signal.
+
+        Args:
+            spinbox_class: QSpinBox or QDoubleSpinBox.
+            minimum: The minimum value.
+            maximum: The maximum value. If None, the Qt default is kept.
+            slot: Called when the value changes.
+
+        Returns:
+            The new spin box.
+        """
+        spinbox = spinbox_class()
+        spinbox.setMinimum(minimum)
+        if maximum is not None:
+            spinbox.setMaximum(maximum)
+        spinbox.valueChanged.connect(slot)
+        return spinbox
 
     def _setup_toolbar(self):
         """Creates and configures the main toolbar."""
@@ -535,6 +746,10 @@ class MainWindow(QMainWindow):
         # Layers Dock
         self._layer_list = QListWidget()
         self._layer_list.setDragDropMode(QListWidget.InternalMove)  # Enable reordering
+        # One item at a time: currentItemChanged is then the only selection signal needed
+        self._layer_list.setSelectionMode(QListWidget.SingleSelection)
+        # All items have the same height (thumbnail + name): lets Qt skip per-item size hints
+        self._layer_list.setUniformItemSizes(True)
         self._layer_list.model().rowsMoved.connect(self._on_layer_rows_moved)
         self._layer_list.currentItemChanged.connect(self._on_layer_current_item_changed)
         self._layer_list.itemDoubleClicked.connect(self._on_layer_item_double_clicked)
@@ -548,6 +763,9 @@ class MainWindow(QMainWindow):
         # Partitions Dock
         self._partition_list = DeselectableListWidget()
         self._partition_list.setDragDropMode(QListWidget.InternalMove)  # Enable reordering
+        # One item at a time: currentItemChanged is then the only selection signal needed
+        self._partition_list.setSelectionMode(QListWidget.SingleSelection)
+        self._partition_list.setUniformItemSizes(True)
         self._partition_list.model().rowsMoved.connect(self._on_partition_rows_moved)
         self._partition_list.currentItemChanged.connect(self._on_partition_current_item_changed)
         self._partition_list.itemDoubleClicked.connect(self._on_partition_item_double_clicked)
@@ -555,6 +773,7 @@ class MainWindow(QMainWindow):
         self._partitions_dock.setObjectName("partitions_dock")
         self._partitions_dock.setWidget(self._partition_list)
         self.addDockWidget(Qt.RightDockWidgetArea, self._partitions_dock)
+        self._partitions_dock.visibilityChanged.connect(self._on_partitions_dock_visibility_changed)
 
     def _setup_property_dock(self):
         """Creates the dock widget for editing layer properties."""
@@ -568,14 +787,14 @@ class MainWindow(QMainWindow):
         self._name_edit.editingFinished.connect(self._on_update_layer_property)
         self._property_layout.addRow(self.tr("Name:"), self._name_edit)
 
-        self._position_x_spinbox = QDoubleSpinBox()
-        self._position_x_spinbox.setRange(-1000.0, 1000.0)
-        self._position_x_spinbox.valueChanged.connect(self._on_update_layer_property)
+        self._position_x_spinbox = self._create_spinbox(
+            QDoubleSpinBox, -1000.0, 1000.0, self._on_update_layer_property
+        )
         self._property_layout.addRow(self.tr("Position X (mm):"), self._position_x_spinbox)
 
-        self._position_y_spinbox = QDoubleSpinBox()
-        self._position_y_spinbox.setRange(-1000.0, 1000.0)
-        self._position_y_spinbox.valueChanged.connect(self._on_update_layer_property)
+        self._position_y_spinbox = self._create_spinbox(
+            QDoubleSpinBox, -1000.0, 1000.0, self._on_update_layer_property
+        )
         self._property_layout.addRow(self.tr("Position Y (mm):"), self._position_y_spinbox)
 
         self._pixel_aspect_ratio_combo = QComboBox()
@@ -585,14 +804,14 @@ class MainWindow(QMainWindow):
         )
         self._property_layout.addRow(self.tr("Pixel Aspect Ratio:"), self._pixel_aspect_ratio_combo)
 
-        self._pixel_width_spinbox = QDoubleSpinBox()
-        self._pixel_width_spinbox.setMinimum(1.0)
-        self._pixel_width_spinbox.valueChanged.connect(self._on_pixel_width_changed)
+        self._pixel_width_spinbox = self._create_spinbox(
+            QDoubleSpinBox, 1.0, None, self._on_pixel_width_changed
+        )
         self._property_layout.addRow(self.tr("Pixel Width (mm):"), self._pixel_width_spinbox)
 
-        self._pixel_height_spinbox = QDoubleSpinBox()
-        self._pixel_height_spinbox.setMinimum(1.0)
-        self._pixel_height_spinbox.valueChanged.connect(self._on_update_layer_property)
+        self._pixel_height_spinbox = self._create_spinbox(
+            QDoubleSpinBox, 1.0, None, self._on_update_layer_property
+        )
         self._property_layout.addRow(self.tr("Pixel Height (mm):"), self._pixel_height_spinbox)
 
         self._rotation_slider = QSlider(Qt.Horizontal)
@@ -600,10 +819,12 @@ class MainWindow(QMainWindow):
         self._rotation_slider.setValue(0)
         self._rotation_slider.valueChanged.connect(self._on_update_layer_property)
 
-        self._rotation_spinbox = QSpinBox()
-        self._rotation_spinbox.setRange(0, 360)
-        self._rotation_spinbox.setValue(0)
-        self._rotation_spinbox.valueChanged.connect(self._rotation_slider.setValue)
+        # Keep the slider and the spinbox in sync. setValue() does nothing if the value is the
+        # same, so this doesn't loop.
+        self._rotation_spinbox = self._create_spinbox(
+            QSpinBox, 0, 360, self._rotation_slider.setValue
+        )
+        self._rotation_slider.valueChanged.connect(self._rotation_spinbox.setValue)
 
         hbox = QHBoxLayout()
         hbox.addWidget(self._rotation_spinbox)
@@ -620,6 +841,36 @@ class MainWindow(QMainWindow):
         self._opacity_slider.valueChanged.connect(self._on_update_layer_property)
         self._property_layout.addRow(self.tr("Opacity:"), self._opacity_slider)
 
+        # Apply the last throttled value right away when the user is done editing
+        for slider in (self._rotation_slider, self._opacity_slider):
+            slider.sliderReleased.connect(self._flush_pending_property_update)
+        for spinbox in (
+            self._position_x_spinbox,
+            self._position_y_spinbox,
+            self._pixel_width_spinbox,
+            self._pixel_height_spinbox,
+            self._rotation_spinbox,
+        ):
+            spinbox.editingFinished.connect(self._flush_pending_property_update)
+
+        # (widget, getter, setter, value from LayerProperties) used by _populate_property_editor
+        self._property_bindings = (
+            (self._name_edit, "text", "setText", lambda p: p.name),
+            (self._position_x_spinbox, "value", "setValue", lambda p: p.position[0]),
+            (self._position_y_spinbox, "value", "setValue", lambda p: p.position[1]),
+            (self._rotation_slider, "value", "setValue", lambda p: round(p.rotation)),
+            (self._pixel_width_spinbox, "value", "setValue", lambda p: p.pixel_size[0]),
+            (self._pixel_height_spinbox, "value", "setValue", lambda p: p.pixel_size[1]),
+            (self._visible_checkbox, "isChecked", "setChecked", lambda p: p.visible),
+            (self._opacity_slider, "value", "setValue", lambda p: round(p.opacity * 100)),
+            (
+                self._pixel_aspect_ratio_combo,
+                "currentText",
+                "setCurrentText",
+                lambda p: p.pixel_aspect_ratio_mode,
+            ),
+        )
+
         self._property_dock = QDockWidget(self.tr("Layer Properties"), self)
         self._property_dock.setObjectName("property_dock")
         self._property_dock.setWidget(self._property_editor)
@@ -633,57 +884,44 @@ class MainWindow(QMainWindow):
         self._embroidery_params_editor.setEnabled(False)
         self._embroidery_params_layout = QFormLayout(self._embroidery_params_editor)
 
-        self._pull_compensation_spinbox = QDoubleSpinBox()
-        self._pull_compensation_spinbox.setMinimum(0.0)
-        self._pull_compensation_spinbox.setMaximum(1000.0)
-        self._pull_compensation_spinbox.valueChanged.connect(self._on_update_embroidery_property)
+        self._pull_compensation_spinbox = self._create_spinbox(
+            QDoubleSpinBox, 0.0, 1000.0, self._on_update_embroidery_property
+        )
         self._embroidery_params_layout.addRow(
             self.tr("Pull Compensation (mm):"), self._pull_compensation_spinbox
         )
 
-        self._max_stitch_length_spinbox = QDoubleSpinBox()
-        self._max_stitch_length_spinbox.setMinimum(0.0)
-        self._max_stitch_length_spinbox.setMaximum(2000.0)
-        self._max_stitch_length_spinbox.valueChanged.connect(self._on_update_embroidery_property)
+        self._max_stitch_length_spinbox = self._create_spinbox(
+            QDoubleSpinBox, 0.0, 2000.0, self._on_update_embroidery_property
+        )
         self._embroidery_params_layout.addRow(
             self.tr("Max Stitch Length (mm):"), self._max_stitch_length_spinbox
         )
 
-        self._min_jump_stitch_length_spinbox = QDoubleSpinBox()
-        self._min_jump_stitch_length_spinbox.setMinimum(0.0)
-        self._min_jump_stitch_length_spinbox.setMaximum(2000.0)
-        self._min_jump_stitch_length_spinbox.valueChanged.connect(
-            self._on_update_embroidery_property
+        self._min_jump_stitch_length_spinbox = self._create_spinbox(
+            QDoubleSpinBox, 0.0, 2000.0, self._on_update_embroidery_property
         )
         self._embroidery_params_layout.addRow(
             self.tr("Min Jump Stitch Length (mm):"), self._min_jump_stitch_length_spinbox
         )
 
         self._fill_method_combo = QComboBox()
-        fill_items = {
-            "auto_fill": self.tr("Auto Fill"),
-            "circular_fill": self.tr("Circular Fill"),
-            "contour_fill": self.tr("Contour Fill"),
-            "legacy_fill": self.tr("Legacy Fill"),
-        }
-        for k, v in fill_items.items():
-            self._fill_method_combo.addItem(v, k)
+        for fill_method, text in FILL_METHODS:
+            self._fill_method_combo.addItem(self.tr(text), fill_method)
         self._fill_method_combo.currentIndexChanged.connect(self._on_update_embroidery_property)
         self._fill_method_combo.currentIndexChanged.connect(self._update_embroidery_ui_state)
         self._embroidery_params_layout.addRow(self.tr("Fill Method:"), self._fill_method_combo)
 
-        self._odd_angle_spinbox = QSpinBox()
-        self._odd_angle_spinbox.setMinimum(0)
-        self._odd_angle_spinbox.setMaximum(360)
-        self._odd_angle_spinbox.valueChanged.connect(self._on_update_embroidery_property)
+        self._odd_angle_spinbox = self._create_spinbox(
+            QSpinBox, 0, 360, self._on_update_embroidery_property
+        )
         self._embroidery_params_layout.addRow(
             self.tr("Odd-Pixel Angle (degrees):"), self._odd_angle_spinbox
         )
 
-        self._even_angle_spinbox = QSpinBox()
-        self._even_angle_spinbox.setMinimum(0)
-        self._even_angle_spinbox.setMaximum(360)
-        self._even_angle_spinbox.valueChanged.connect(self._on_update_embroidery_property)
+        self._even_angle_spinbox = self._create_spinbox(
+            QSpinBox, 0, 360, self._on_update_embroidery_property
+        )
         self._embroidery_params_layout.addRow(
             self.tr("Even-Pixel Angle (degrees):"), self._even_angle_spinbox
         )
@@ -705,9 +943,9 @@ class MainWindow(QMainWindow):
         self._undo_dock.setObjectName("undo_dock")
         self._undo_dock.setHidden(True)
         self._undo_dock.setFloating(True)
-        self._undo_view = QUndoView()
-        self._undo_view.setObjectName("undo_view")
-        self._undo_dock.setWidget(self._undo_view)
+        # The dock is hidden by default: the view is created the first time it is shown
+        self._undo_view: QUndoView | None = None
+        self._undo_dock.visibilityChanged.connect(self._on_undo_dock_visibility_changed)
         self.addDockWidget(Qt.RightDockWidgetArea, self._undo_dock)
 
     def _setup_statusbar(self):
@@ -725,84 +963,113 @@ class MainWindow(QMainWindow):
         self._cursor_position_label = QLabel()
         self._statusbar.addWidget(self._cursor_position_label)
 
+    def _schedule_update_statusbar(self) -> None:
+        """
+        Updates the status bar once the control returns to the event loop.
+
+        Opening a project emits one "layer added" per layer. They all get coalesced into a
+        single update.
+        """
+        if not self._statusbar_update_scheduled:
+            self._statusbar_update_scheduled = True
+            QTimer.singleShot(0, self._update_statusbar)
+
+    @Slot()
     def _update_statusbar(self):
         """Updates the status bar with current project statistics."""
-        colors = set()
-        total_partitions = 0
-        total_pixels = 0
-        if self.state is not None:
-            for layer in self.state.layers:
-                for partition in layer.partitions.values():
-                    total_partitions += 1
-                    colors.add(partition.color)
-                    total_pixels += partition.pixel_count
+        self._statusbar_update_scheduled = False
+        stats = self.state.statistics if self.state is not None else (0, 0, 0)
+        if stats == self._statusbar_stats:
+            # Avoid relayouting and repainting the labels
+            return
+        self._statusbar_stats = stats
+
+        total_colors, total_partitions, total_pixels = stats
+        self._total_colors_label.setText(self.tr("Total Colors: {}").format(total_colors))
+        self._total_partitions_label.setText(
+            self.tr("Total Partitions: {}").format(total_partitions)
+        )
+        self._total_pixels_label.setText(self.tr("Total Pixels: {}").format(total_pixels))
 
-        self._total_colors_label.setText(self.tr(f"Total Colors: {len(colors)}"))
-        self._total_partitions_label.setText(self.tr(f"Total Partitions: {total_partitions}"))
-        self._total_pixels_label.setText(self.tr(f"Total Pixels: {total_pixels}"))
+    def _invalidate_recent_menu(self):
+        """Marks the 'Recent Files' menu as outdated. It gets rebuilt the next time it is shown."""
+        self._recent_menu_dirty = True
+        self._recent_menu.setEnabled(len(get_global_preferences().get_recent_files()) > 0)
+
+    @Slot()
+    def _on_recent_menu_about_to_show(self):
+        """Slot to rebuild the 'Recent Files' menu, only if it changed since the last time."""
+        if self._recent_menu_dirty:
+            self._populate_recent_menu()
 
     def _populate_recent_menu(self):
         """Populates the 'Recent Files' menu with a list of recently opened files."""
-        self._recent_menu.clear()
-        recent_files = get_global_preferences().get_recent_files()
-        for file_name in recent_files:
-            action = QAction(os.path.basename(file_name), self)
-            action.setData(file_name)
-            action.triggered.connect(self._on_recent_file)
-            self._recent_menu.addAction(action)
-
-        self._recent_menu.addSeparator()
-        action = QAction(QIcon.fromTheme("edit-clear"), self.tr("Clear Menu"), self)
-        action.triggered.connect(self._on_clear_recent_files)
-        self._recent_menu.addAction(action)
+        self._recent_menu_dirty = False
+        recent_files = tuple(get_global_preferences().get_recent_files())
+        if recent_files == self._recent_menu_files:
+            # e.g.: the most recent file was opened again
+            return
+        self._recent_menu_files = recent_files
+        for i, action in enumerate(self._recent_actions):
+            if i < len(recent_files):
+                action.setText(os.path.basename(recent_files[i]))
+                action.setData(recent_files[i])
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
 
         self._recent_menu.setEnabled(len(recent_files) > 0)
 
+    def _schedule_update_qactions(self) -> None:
+        """
+        Updates the QActions once the control returns to the event loop.
+
+        A single user action can trigger several slots that need it. They all get coalesced
+        into one.
+        """
+        if not self._qactions_update_scheduled:
+            self._qactions_update_scheduled = True
+            QTimer.singleShot(0, self._update_qactions)
+
+    @Slot()
     def _update_qactions(self):
         """Enables or disables QActions based on whether a project is open."""
+        self._qactions_update_scheduled = False
         enabled = self.state is not None
 
-        self._save_action.setEnabled(enabled)
-        self._save_as_action.setEnabled(enabled)
-        self._close_action.setEnabled(enabled)
-        self._export_action.setEnabled(enabled)
-        self._export_as_action.setEnabled(enabled)
-        self._export_to_png_as_action.setEnabled(enabled)
-
-        self._add_text_layer_action.setEnabled(enabled)
-        self._add_image_layer_action.setEnabled(enabled)
-        self._delete_layer_action.setEnabled(enabled)
-        self._duplicate_layer_action.setEnabled(enabled)
-        self._fit_to_hoop_action.setEnabled(enabled)
-
-        self._edit_partition_action.setEnabled(enabled)
+        # These only depend on whether there is a project: skip them if that did not change.
+        if enabled != self._last_qactions_enabled:
+            self._last_qactions_enabled = enabled
+            for action in self._project_actions:
+                action.setEnabled(enabled)
 
-        self._zoom_in_action.setEnabled(enabled)
-        self._zoom_out_action.setEnabled(enabled)
-        self._zoom_reset_action.setEnabled(enabled)
-        self._zoom_fit_action.setEnabled(enabled)
+            # Not really actions, but should be disabled anyway
+            self._layer_list.setEnabled(enabled)
+            self._partition_list.setEnabled(enabled)
 
-        for action in self._align_actions.values():
-            action.setEnabled(enabled)
+        can_save = enabled and self.state not in self._saving_states
 
-        # Not really actions, but should be disabled anyway
-        self._layer_list.setEnabled(enabled)
-        self._partition_list.setEnabled(enabled)
-        self._reorder_partitions_action.setEnabled(enabled)
-        self._delete_partition_action.setEnabled(enabled)
-
-        # Only enable property editors if a layer is selected
+        # Only enable property editors if a layer is selected.
+        # Other slots enable / disable the editors too: always update them.
         layer_selected = enabled and self._layer_list.currentItem() is not None
         self._property_editor.setEnabled(layer_selected)
         self._embroidery_params_editor.setEnabled(layer_selected)
-        self._flip_horizontal_action.setEnabled(layer_selected)
-        self._flip_vertical_action.setEnabled(layer_selected)
 
         # Only enable Edit Pixels if an ImageLayer is selected
         is_image_layer = False
         if layer_selected and self.state:
             layer = self.state.selected_layer
             is_image_layer = isinstance(layer, ImageLayer)
+
+        # The actions below are only updated here: skip them if nothing changed
+        layer_actions_state = (can_save, layer_selected, is_image_layer)
+        if layer_actions_state == self._last_layer_actions_state:
+            return
+        self._last_layer_actions_state = layer_actions_state
+        self._save_action.setEnabled(can_save)
+        self._save_as_action.setEnabled(can_save)
+        self._flip_horizontal_action.setEnabled(layer_selected)
+        self._flip_vertical_action.setEnabled(layer_selected)
         self._edit_layer_pixels_action.setEnabled(is_image_layer)
 
     def _load_settings(self):
@@ -855,8 +1122,8 @@ class MainWindow(QMainWindow):
             is_dirty = not self.state.undo_stack.isClean()
             dirty_str = "*" if is_dirty else ""
             filename = "(untitled)"
-            if self.state.project_filename is not None:
-                filename = f"{os.path.basename(self.state.project_filename)}"
+            if self.state.project_basename is not None:
+                filename = self.state.project_basename
             title = f"{filename}{dirty_str} - {title}"
         self.setWindowTitle(title)
 
@@ -868,16 +1135,22 @@ class MainWindow(QMainWindow):
 
         state = widget.state
         filename = self.tr("Untitled")
-        if state.project_filename:
-            filename = os.path.basename(state.project_filename)
+        if state.project_basename:
+            filename = state.project_basename
 
         is_dirty = not state.undo_stack.isClean()
         dirty_str = "*" if is_dirty else ""
 
         self._tab_widget.setTabText(index, f"{filename}{dirty_str}")
 
-    def _on_document_clean_changed(self, doc: Document):
-        """Slot called when a document's clean state changes."""
+    def _on_document_clean_changed(self, doc: Document, clean: bool):
+        """
+        Slot called when a document's clean state changes.
+
+        Args:
+            doc: The document whose undo stack changed.
+            clean: Whether the undo stack is now clean.
+        """
         index = self._tab_widget.indexOf(doc)
         if index != -1:
             self._update_tab_title(index)
@@ -904,28 +1177,43 @@ class MainWindow(QMainWindow):
         self._create_document(state, filename)
 
         get_global_preferences().add_recent_file(filename)
-        self._populate_recent_menu()
+        self._invalidate_recent_menu()
+
+    def _document_connections(self, doc: Document) -> tuple:
+        """
+        Returns the signal-slot pairs that tie a document to the main window.
+
+        Args:
+            doc: The document whose state and canvas signals are returned.
+
+        Returns:
+            A tuple of (signal, slot) pairs.
+        """
+        state = doc.state
+        canvas = doc.canvas
+        return (
+            (state.layer_property_changed, self._on_state_layer_property_changed),
+            (state.state_property_changed, self._on_state_state_property_changed),
+            (state.partition_route_updated, self._on_state_partition_route_updated),
+            (state.layer_partitions_changed, self._on_state_layer_partitions_changed),
+            (state.layers_reordered, self._on_state_layers_reordered),
+            (state.layer_removed, self._on_state_layer_removed),
+            (state.layer_pixels_changed, self._on_state_layer_pixels_changed),
+            (state.layer_added, self._on_state_layer_added),
+            (canvas.position_changed, self._on_canvas_position_changed),
+            (canvas.layer_selection_changed, self._on_canvas_layer_selection_changed),
+            (canvas.layer_double_clicked, self._on_canvas_layer_double_clicked),
+            (canvas.cursor_position_changed, self._on_canvas_cursor_position_changed),
+        )
 
     def _connect_document_signals(self, doc: Document):
         """Connects signals from the document's state and canvas."""
         if not doc:
             return
 
-        state = doc.state
-        state.layer_property_changed.connect(self._on_state_layer_property_changed)
-        state.state_property_changed.connect(self._on_state_state_property_changed)
-        state.partition_route_updated.connect(self._on_state_partition_route_updated)
-        state.layer_partitions_changed.connect(self._on_state_layer_partitions_changed)
-        state.layers_reordered.connect(self._on_state_layers_reordered)
-        state.layer_removed.connect(self._on_state_layer_removed)
-        state.layer_pixels_changed.connect(self._on_state_layer_pixels_changed)
-        state.layer_added.connect(self._on_state_layer_added)
-
-        canvas = doc.canvas
-        canvas.position_changed.connect(self._on_canvas_position_changed)
-        canvas.layer_selection_changed.connect(self._on_canvas_layer_selection_changed)
-        canvas.layer_double_clicked.connect(self._on_canvas_layer_double_clicked)
-        canvas.cursor_position_changed.connect(self._on_canvas_cursor_position_changed)
+        # UniqueConnection: connecting the same document twice must not call the slots twice
+        for signal, slot in self._document_connections(doc):
+            signal.connect(slot, Qt.UniqueConnection)
 
     def _disconnect_document_signals(self, doc: Document):
         """Disconnects signals from the document."""
@@ -934,23 +1222,14 @@ class MainWindow(QMainWindow):
 
         # Use try-pass to handle cases where objects are already deleted
         try:
-            state = doc.state
-            state.layer_property_changed.disconnect(self._on_state_layer_property_changed)
-            state.state_property_changed.disconnect(self._on_state_state_property_changed)
-            state.partition_route_updated.disconnect(self._on_state_partition_route_updated)
-            state.layer_partitions_changed.disconnect(self._on_state_layer_partitions_changed)
-            state.layers_reordered.disconnect(self._on_state_layers_reordered)
-            state.layer_removed.disconnect(self._on_state_layer_removed)
-            state.layer_pixels_changed.disconnect(self._on_state_layer_pixels_changed)
-            state.layer_added.disconnect(self._on_state_layer_added)
-
-            canvas = doc.canvas
-            canvas.position_changed.disconnect(self._on_canvas_position_changed)
-            canvas.layer_selection_changed.disconnect(self._on_canvas_layer_selection_changed)
-            canvas.layer_double_clicked.disconnect(self._on_canvas_layer_double_clicked)
-            canvas.cursor_position_changed.disconnect(self._on_canvas_cursor_position_changed)
-        except (RuntimeError, TypeError, ValueError):
-            pass
+            connections = self._document_connections(doc)
+        except RuntimeError:
+            return
+        for signal, slot in connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError, ValueError):
+                pass
 
     def _add_layer(self, layer: Layer):
         """
@@ -988,10 +1267,8 @@ class MainWindow(QMainWindow):
             layer: The layer whose partitions are to be displayed.
         """
         # Called from on_layer_item_changed
-        with block_signals(self._partition_list):
-            self._partition_list.clear()
-
         if len(layer.partitions) == 0:
+            self._clear_partition_list()
             # Sanity check
             layer.selected_partition_uuid = None
             logger.warning(
@@ -999,25 +1276,97 @@ class MainWindow(QMainWindow):
             )
             return
 
-        selected_partition_idx = -1
-        # First: add all items
-        for i, (partition_key, partition) in enumerate(layer.partitions.items()):
-            item = QListWidgetItem(partition.name)
-            item.setData(Qt.UserRole, partition_key)
+        if self._partitions_dock.isHidden():
+            self._clear_partition_list()
+            # Populated once the dock is shown again
+            self._partition_list_dirty = True
+            return
+        self._partition_list_dirty = False
+
+        self._partition_keys = list(layer.partitions.keys())
+        selected_item: QListWidgetItem | None = None
+        # First: update the items, repainting the list only once at the end.
+        # The existing rows are reused; only the difference in count is added or removed.
+        with updates_disabled(self._partition_list), block_signals(self._partition_list):
+            while self._partition_list.count() > len(self._partition_keys):
+                self._partition_list.takeItem(self._partition_list.count() - 1)
+
+            for row, (partition_key, partition) in enumerate(layer.partitions.items()):
+                item = self._partition_list.item(row)
+                if item is None:
+                    item = QListWidgetItem()
+                    self._partition_list.addItem(item)
+                item.setText(partition.name)
+                item.setData(Qt.UserRole, partition_key)
 
-            # Create a solid color icon swatch
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(QColor(partition.color))
-            item.setIcon(QIcon(pixmap))
+                # Create a solid color icon swatch
+                pixmap = QPixmap(16, 16)
+                pixmap.fill(QColor(partition.color))
+                item.setIcon(QIcon(pixmap))
 
-            self._partition_list.addItem(item)
-            if layer.selected_partition_uuid == partition_key:
-                selected_partition_idx = i
+                if layer.selected_partition_uuid == partition_key:
+                    selected_item = item
 
-        # Second: select the correct one if present
-        if selected_partition_idx >= 0:
-            with block_signals(self._partition_list):
-                self._partition_list.setCurrentRow(selected_partition_idx)
+            # Second: select the correct one if present
+            if selected_item is not None:
+                self._partition_list.setCurrentItem(selected_item)
+            else:
+                self._partition_list.setCurrentRow(-1)
+
+    @Slot(bool)
+    def _on_undo_dock_visibility_changed(self, visible: bool) -> None:
+        """
+        Slot for when the Undo List dock is shown or hidden.
+
+        Creates the undo view the first time the dock is shown.
+
+        Args:
+            visible: Whether the dock is now visible.
+        """
+        if not visible or self._undo_view is not None:
+            return
+        # Follows the active stack of the group. Empty when there is no document.
+        self._undo_view = QUndoView(self._undo_group)
+        self._undo_view.setObjectName("undo_view")
+        self._undo_dock.setWidget(self._undo_view)
+
+    @Slot(bool)
+    def _on_partitions_dock_visibility_changed(self, visible: bool) -> None:
+        """
+        Slot for when the Partitions dock is shown or hidden.
+
+        Populates the partition list if it changed while the dock was hidden.
+
+        Args:
+            visible: Whether the dock is now visible.
+        """
+        if not visible or not self._partition_list_dirty:
+            return
+        self._partition_list_dirty = False
+        layer = self.state.selected_layer if self.state is not None else None
+        if layer is not None:
+            self._populate_partitions(layer)
+
+    def _clear_partition_list(self) -> None:
+        """Removes all the items from the partition list, without triggering any slot."""
+        with block_signals(self._partition_list):
+            self._partition_list.clear()
+        self._partition_keys = []
+
+    @contextmanager
+    def _suppress_callbacks(self):
+        """
+        Context manager that makes the property and embroidery editor slots ignore updates.
+
+        The editor widgets stay connected; their slots simply return early while the editors
+        are being populated programmatically.
+        """
+        previous = self._suppress_property_slots
+        self._suppress_property_slots = True
+        try:
+            yield
+        finally:
+            self._suppress_property_slots = previous
 
     def _populate_property_editor(self, properties: LayerProperties) -> None:
         """
@@ -1026,29 +1375,17 @@ class MainWindow(QMainWindow):
         Args:
             properties: The layer properties to display.
         """
-        with block_signals(self._name_edit):
-            self._name_edit.setText(properties.name)
-        with block_signals(self._position_x_spinbox):
-            self._position_x_spinbox.setValue(properties.position[0])
-        with block_signals(self._position_y_spinbox):
-            self._position_y_spinbox.setValue(properties.position[1])
-        with block_signals(self._rotation_slider):
-            self._rotation_slider.setValue(round(properties.rotation))
-        with block_signals(self._rotation_spinbox):
-            self._rotation_spinbox.setValue(round(properties.rotation))
-        with block_signals(self._pixel_width_spinbox):
-            self._pixel_width_spinbox.setValue(properties.pixel_size[0])
-        with block_signals(self._pixel_height_spinbox):
-            self._pixel_height_spinbox.setValue(properties.pixel_size[1])
-        with block_signals(self._visible_checkbox):
-            self._visible_checkbox.setChecked(properties.visible)
-        with block_signals(self._opacity_slider):
-            self._opacity_slider.setValue(round(properties.opacity * 100))
-        with block_signals(self._pixel_aspect_ratio_combo):
-            self._pixel_aspect_ratio_combo.setCurrentText(properties.pixel_aspect_ratio_mode)
+        # Only the rotation slider is set: it updates the rotation spinbox
+        with self._suppress_callbacks():
+            for widget, getter, setter, value_for in self._property_bindings:
+                value = value_for(properties)
+                if getattr(widget, getter)() != value:
+                    getattr(widget, setter)(value)
 
         # Update UI state based on mode
         self._pixel_height_spinbox.setEnabled(properties.pixel_aspect_ratio_mode == "Freeform")
+        # Layer setters modify the properties in place: keep a copy
+        self._last_properties_shown = dataclasses.replace(properties)
 
     def _populate_embroidery_editor(self, embroidery_params: EmbroideryParameters):
         """
@@ -1057,23 +1394,23 @@ class MainWindow(QMainWindow):
         Args:
             embroidery_params: The embroidery parameters to display.
         """
-        with block_signals(self._pull_compensation_spinbox):
-            self._pull_compensation_spinbox.setValue(embroidery_params.pull_compensation_mm)
-        with block_signals(self._max_stitch_length_spinbox):
-            self._max_stitch_length_spinbox.setValue(embroidery_params.max_stitch_length_mm)
-        with block_signals(self._min_jump_stitch_length_spinbox):
-            self._min_jump_stitch_length_spinbox.setValue(
-                embroidery_params.min_jump_stitch_length_mm
+        with self._suppress_callbacks():
+            set_value_if_changed(
+                self._pull_compensation_spinbox, embroidery_params.pull_compensation_mm
+            )
+            set_value_if_changed(
+                self._max_stitch_length_spinbox, embroidery_params.max_stitch_length_mm
+            )
+            set_value_if_changed(
+                self._min_jump_stitch_length_spinbox, embroidery_params.min_jump_stitch_length_mm
             )
-        with block_signals(self._odd_angle_spinbox):
-            self._odd_angle_spinbox.setValue(embroidery_params.odd_pixel_angle_degrees)
-        with block_signals(self._even_angle_spinbox):
-            self._even_angle_spinbox.setValue(embroidery_params.even_pixel_angle_degrees)
-        with block_signals(self._fill_method_combo):
-            index = self._fill_method_combo.findData(embroidery_params.fill_method)
+            set_value_if_changed(self._odd_angle_spinbox, embroidery_params.odd_pixel_angle_degrees)
+            set_value_if_changed(
+                self._even_angle_spinbox, embroidery_params.even_pixel_angle_degrees
+            )
+            index = FILL_METHOD_INDEXES.get(embroidery_params.fill_method, -1)
             if index != -1:
                 self._fill_method_combo.setCurrentIndex(index)
-        with block_signals(self._fill_underlay_checkbox):
             self._fill_underlay_checkbox.setChecked(embroidery_params.fill_underlay)
 
         self._update_embroidery_ui_state()
@@ -1112,6 +1449,8 @@ class MainWindow(QMainWindow):
         if layer is None:
             logger.warning(f"Cannot find layer with UUID {layer_uuid}")
         if isinstance(layer, TextLayer):
+            from font_dialog import FontDialog
+
             dialog = FontDialog(layer.text, layer.font_name, layer.color_name)
             if dialog.exec() == QDialog.Accepted:
                 text, font_name, color_name = dialog.get_data()
@@ -1136,6 +1475,14 @@ class MainWindow(QMainWindow):
         Args:
             event: The close event.
         """
+        self._flush_pending_property_update()
+        if self._saving_states:
+            # Don't quit while a project is being written. Deliver the "finished" signals
+            # so that the saved projects are marked as clean.
+            from PySide6.QtCore import QThreadPool
+
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.sendPostedEvents()
         # Check all documents for unsaved changes
         for i in range(self._tab_widget.count()):
             doc = self._tab_widget.widget(i)
@@ -1173,27 +1520,56 @@ class MainWindow(QMainWindow):
             # If opening an image, create a new project for it
             state = State()
             doc = self._create_document(state, None)
-            layer = ImageLayer(filename)
-            layer.name = f"ImageLayer {len(doc.state.layers) + 1}"
-            self._parse_layer_asynchronously(
-                layer,
-                QColor(doc.state.canvas_background_color),
-                lambda layer_obj: doc.state.add_layer(layer_obj),
+
+            def on_loaded(layer):
+                layer.name = f"ImageLayer {doc.state.next_layer_number()}"
+                doc.state.add_layer(layer)
+
+            self._load_image_layer_asynchronously(
+                filename, QColor(doc.state.canvas_background_color), on_loaded
             )
 
+    def _get_open_filename(self, caption: str, directory: str, file_filter: str) -> str:
+        """
+        Asks the user for an existing file, using the native file dialog when available.
+
+        Args:
+            caption: The title of the dialog.
+            directory: The initial directory or file.
+            file_filter: The file type filters, separated by ";;".
+
+        Returns:
+            The selected file, or an empty string if the dialog was canceled.
+        """
+        filename, _ = QFileDialog.getOpenFileName(
+            self, caption, directory, file_filter, options=FILE_DIALOG_OPTIONS
+        )
+        return filename
+
+    def _get_save_filename(
+        self, caption: str, directory: str, file_filter: str, selected_filter: str = ""
+    ) -> str:
+        """
+        Asks the user for a file to write, using the native file dialog when available.
+
+        Args:
+            caption: The title of the dialog.
+            directory: The initial directory or file.
+            file_filter: The file type filters, separated by ";;".
+            selected_filter: The filter selected when the dialog opens.
+
+        Returns:
+            The selected file, or an empty string if the dialog was canceled.
+        """
+        filename, _ = QFileDialog.getSaveFileName(
+            self, caption, directory, file_filter, selected_filter, options=FILE_DIALOG_OPTIONS
+        )
+        return filename
+
     @Slot()
     def _on_file_open(self) -> None:
         """Slot for opening a project file or importing an image."""
-        options = QFileDialog.Options()
-        filename, _ = QFileDialog.getOpenFileName(
-            self,
-            self.tr("Open File"),
-            "",
-            self.tr(
-                "All Supported Files (*.pixemproj *.png *.jpg *.bmp );;Pixem project (*.pixemproj);;All files (*)"
-            ),
-            options=options,
-        )
+        filename = self._get_open_filename(self.tr("Open File"), "", self._open_file_filter)
         if filename:
             self.open_file(filename)
         else:
@@ -1209,53 +1585,118 @@ class MainWindow(QMainWindow):
     def _on_clear_recent_files(self) -> None:
         """Slot for clearing the 'Recent Files' menu."""
         get_global_preferences().clear_recent_files()
-        self._populate_recent_menu()
+        self._invalidate_recent_menu()
 
     @Slot()
     def _on_save_project(self) -> None:
         """Slot for saving the current project."""
-        if self.state is None:
+        if self.state is None or self.state in self._saving_states:
             return
+        self._flush_pending_property_update()
         filename = self.state.project_filename
         if filename is None:
             self._on_save_project_as()
             return
-        self.state.save_to_filename(filename)
+        self._save_state_to_filename(self.state, filename)
 
     @Slot()
     def _on_save_project_as(self) -> None:
         """Slot for saving the current project to a new file."""
-        if self.state is None:
+        if self.state is None or self.state in self._saving_states:
             return
-        filename, _ = QFileDialog.getSaveFileName(
-            self, self.tr("Save Project"), "", self.tr("Pixem files (*.pixemproj);;All files (*)")
-        )
+        filename = self._get_save_filename(self.tr("Save Project"), "", self._project_file_filter)
         if filename:
             _, ext = os.path.splitext(filename)
             if ext != ".pixemproj":
                 filename = filename + ".pixemproj"
-            self.state.save_to_filename(filename)
-            self._update_window_title()
+            self._save_state_to_filename(self.state, filename, self._on_project_saved_as)
 
-            # Update tab title because filename changed
-            index = self._tab_widget.currentIndex()
-            if index != -1:
-                self._update_tab_title(index)
+    def _on_project_saved_as(self, state: State) -> None:
+        """
+        Updates the UI after a project was saved to a new file.
 
-            get_global_preferences().add_recent_file(filename)
-            self._populate_recent_menu()
+        Args:
+            state: The project that was saved.
+        """
+        self._update_window_title()
+
+        # Update tab title because filename changed
+        for i in range(self._tab_widget.count()):
+            doc = self._tab_widget.widget(i)
+            if isinstance(doc, Document) and doc.state is state:
+                self._update_tab_title(i)
+                break
+
+        get_global_preferences().add_recent_file(state.project_filename)
+        self._invalidate_recent_menu()
+
+    def _save_state_to_filename(self, state: State, filename: str, on_saved=None) -> None:
+        """
+        Saves a project in the thread pool, so that big projects don't block the UI.
+
+        The project is serialized in the UI thread, and only written to disk by the worker.
+        "Save" stays disabled for that project until the worker finishes.
+
+        Args:
+            state: The project to save.
+            filename: The file to save the project to.
+            on_saved: Optional callable, called in the UI thread with the state once it is saved.
+        """
+        from PySide6.QtCore import QThreadPool
+
+        logger.info(f"Saving project to filename {filename}")
+        worker = SaveProjectWorker(state.to_dict(), filename)
+        undo_index = state.undo_stack.index()
+        self._active_workers.add(worker)
+        self._saving_states.add(state)
+        self._schedule_update_qactions()
+        self.statusBar().showMessage(self.tr("Saving project..."))
+
+        def finished(success: bool):
+            self._active_workers.discard(worker)
+            self._saving_states.discard(state)
+            if success:
+                state.mark_saved(filename, undo_index)
+                self.statusBar().showMessage(self.tr("Project saved"), 3000)
+                if on_saved is not None:
+                    on_saved(state)
+            else:
+                self.statusBar().showMessage(self.tr("Error saving project"), 5000)
+            self._schedule_update_qactions()
+
+        worker.signals.finished.connect(finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
 
     @Slot()
     def _on_export_project(self) -> None:
         """Slot for exporting the project to its last used export path."""
         if self.state is None:
             return
-        filename = self.state.properties.export_filename
-        if filename is None or len(filename) == 0 or not os.path.exists(filename):
+        state = self.state
+        filename = state.properties.export_filename
+        if filename is None or len(filename) == 0:
             self._on_export_project_as()
             return
 
-        self.state.export_to_svg(filename)
+        # Checking whether the file still exists might block on slow or network drives:
+        # do it in the thread pool.
+        from PySide6.QtCore import QThreadPool
+
+        worker = FileExistsWorker(filename)
+        self._active_workers.add(worker)
+
+        def finished(exists: bool):
+            self._active_workers.discard(worker)
+            if self.state is not state:
+                # The user switched to another project in the meantime
+                return
+            if exists:
+                state.export_to_svg(filename)
+            else:
+                self._on_export_project_as()
+
+        worker.signals.finished.connect(finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
 
     @Slot()
     def _on_export_project_as(self) -> None:
@@ -1269,11 +1710,10 @@ class MainWindow(QMainWindow):
                 fullpath_svg = f"{base}.svg"
             else:
                 fullpath_svg = "export.svg"
-        filename, _ = QFileDialog.getSaveFileName(
-            self,
+        filename = self._get_save_filename(
             self.tr("Export Project"),
             fullpath_svg,
-            self.tr("SVG (*.svg);;All files (*)"),
+            self._svg_file_filter,
             "SVG (*.svg)",
         )
         if filename:
@@ -1296,19 +1736,48 @@ class MainWindow(QMainWindow):
                 fullpath_svg = "export.svg"
         base, _ = os.path.splitext(fullpath_svg)
         fullpath_png = f"{base}.png"
-        filename, _ = QFileDialog.getSaveFileName(
-            self,
+        filename = self._get_save_filename(
             self.tr("Export Project"),
             fullpath_png,
-            self.tr("PNG (*.png);;All files (*)"),
+            self._png_file_filter,
             "PNG (*.png)",
         )
+        if not filename:
+            return
+        # Render only once the user confirmed the export: it is a full canvas paint
         image = self.canvas.render_to_qimage()
-        if filename and image is not None:
+        if image is not None:
             _, ext = os.path.splitext(filename)
             if ext != ".png":
                 filename = filename + ".png"
-            self.state.export_to_png(filename, image)
+            self._write_png_in_background(image, filename)
+
+    def _write_png_in_background(self, image: QImage, filename: str) -> None:
+        """
+        Encodes and writes a rendered canvas image in the thread pool.
+
+        The image has to be rendered in the UI thread, but PNG compression of a big canvas can
+        take a while.
+
+        Args:
+            image: The rendered canvas.
+            filename: The PNG file to write.
+        """
+        from PySide6.QtCore import QThreadPool
+
+        worker = ExportPngWorker(image, filename)
+        self._active_workers.add(worker)
+        self.statusBar().showMessage(self.tr("Exporting to PNG..."))
+
+        def finished(success: bool):
+            self._active_workers.discard(worker)
+            if success:
+                self.statusBar().showMessage(self.tr("Exported to PNG"), 3000)
+            else:
+                self.statusBar().showMessage(self.tr("Error exporting to PNG"), 5000)
+
+        worker.signals.finished.connect(finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
 
     @Slot()
     def _on_close_project(self) -> None:
@@ -1322,44 +1791,38 @@ class MainWindow(QMainWindow):
         """Slot for exiting the application."""
         QApplication.quit()
 
-    @Slot()
-    def _on_show_hoop_size(self, action: QAction) -> None:
+    @Slot(bool)
+    def _on_show_hoop_size(self, checked: bool) -> None:
         """
         Slot to toggle the visibility of the embroidery hoop guide.
 
         Args:
-            action: The action that triggered the slot.
+            checked: Whether the hoop should be visible.
         """
-        is_checked = action.isChecked()
-        get_global_preferences().set_hoop_visible(is_checked)
+        get_global_preferences().set_hoop_visible(checked)
         if self.canvas:
             self.canvas.on_preferences_updated()
             self.canvas.update()
-        self.update()
 
-    @Slot()
-    def _on_show_grid(self) -> None:
+    @Slot(bool)
+    def _on_show_grid(self, checked: bool) -> None:
         """Slot to toggle the visibility of the canvas grid."""
-        visible = self._show_grid_action.isChecked()
-        get_global_preferences().set_grid_visible(visible)
+        get_global_preferences().set_grid_visible(checked)
 
-    @Slot()
-    def _on_snap_to_grid(self) -> None:
+    @Slot(bool)
+    def _on_snap_to_grid(self, checked: bool) -> None:
         """Slot to toggle snapping to the grid."""
-        snap = self._snap_to_grid_action.isChecked()
-        get_global_preferences().set_snap_to_grid(snap)
+        get_global_preferences().set_snap_to_grid(checked)
 
-    @Slot()
-    def _on_snap_to_hoop(self) -> None:
+    @Slot(bool)
+    def _on_snap_to_hoop(self, checked: bool) -> None:
         """Slot to toggle snapping to the hoop boundaries/center."""
-        snap = self._snap_to_hoop_action.isChecked()
-        get_global_preferences().set_snap_to_hoop(snap)
+        get_global_preferences().set_snap_to_hoop(checked)
 
-    @Slot()
-    def _on_snap_to_layers(self) -> None:
+    @Slot(bool)
+    def _on_snap_to_layers(self, checked: bool) -> None:
         """Slot to toggle snapping to other layers."""
-        snap = self._snap_to_layers_action.isChecked()
-        get_global_preferences().set_snap_to_layers(snap)
+        get_global_preferences().set_snap_to_layers(checked)
 
     @Slot()
     def _on_reset_layout(self) -> None:
@@ -1382,20 +1845,20 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_preferences(self) -> None:
         """Slot to open the preferences dialog."""
+        from preference_dialog import PreferenceDialog
+
+        # No explicit canvas refresh is needed: Preferences only emits its "*_changed" signals
+        # for values that actually changed, and the Canvas listens to them.
         dialog = PreferenceDialog()
-        if dialog.exec() == QDialog.Accepted:
-            if self.state:
-                # If global preferences changed, we might need to update the canvas if it uses global prefs
-                # But Canvas listens to signals, so it should be fine.
-                # However, if we want to enforce state hoop size from global (legacy behavior?), we might need logic here.
-                # But now State has its own hoop size.
-                pass
+        dialog.exec()
 
     @Slot()
     def _on_document_properties(self) -> None:
         """Slot to open the document properties dialog."""
         if self.state is None:
             return
+        from preference_dialog import PreferenceDialog
+
         dialog = PreferenceDialog(self.state)
         dialog.exec()
 
@@ -1404,27 +1867,47 @@ class MainWindow(QMainWindow):
         """Slot to add a new image layer from a file."""
         if self.state is None:
             return
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, self.tr("Open Image"), "", self.tr("Images (*.png *.jpg *.bmp);;All files (*)")
-        )
-        if file_name:
-            layer = ImageLayer(file_name)
-            layer.name = f"ImageLayer {len(self.state.layers) + 1}"
-            self._parse_layer_asynchronously(
-                layer, QColor(self.state.canvas_background_color), self._add_layer
-            )
+        # Use the asynchronous open() instead of getOpenFileName() to avoid a nested event loop
+        dialog = QFileDialog(self, self.tr("Open Image"), "", self._image_file_filter)
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setOptions(FILE_DIALOG_OPTIONS)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._finish_add_image_layer)
+        dialog.open()
+
+    @Slot(str)
+    def _finish_add_image_layer(self, file_name: str) -> None:
+        """
+        Adds an image layer once the user has selected a file.
+
+        Args:
+            file_name: The image file selected in the "Open Image" dialog.
+        """
+        if self.state is None or not file_name:
+            return
+        state = self.state
+
+        def on_loaded(layer):
+            layer.name = f"ImageLayer {state.next_layer_number()}"
+            state.add_layer(layer)
+
+        self._load_image_layer_asynchronously(
+            file_name, QColor(state.canvas_background_color), on_loaded
+        )
 
     @Slot()
     def _on_layer_add_text(self) -> None:
         """Slot to add a new text layer via the FontDialog."""
         if self.state is None:
             return
+        from font_dialog import FontDialog
+
         dialog = FontDialog()
         if dialog.exec() == QDialog.Accepted:
             text, font_name, color_name = dialog.get_data()
             if len(text) > 0:
                 layer = TextLayer(text, font_name, color_name)
-                layer.name = f"TextLayer {len(self.state.layers) + 1}"
+                layer.name = f"TextLayer {self.state.next_layer_number()}"
                 self._parse_layer_asynchronously(
                     layer, QColor(self.state.canvas_background_color), self._add_layer
                 )
@@ -1432,15 +1915,16 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_layer_delete(self) -> None:
         """Slot to delete the currently selected layer."""
+        state = self.state
         selected_items = self._layer_list.selectedItems()
-        layer = self.state.selected_layer
+        layer = state.selected_layer if state is not None else None
 
         if not selected_items or not layer:
             logger.warning("Cannot delete layer, no layers selected")
             return
 
         # Remove it from the state
-        self.state.delete_layer(layer)
+        state.delete_layer(layer)
 
     @Slot()
     def _on_layer_duplicate(self) -> None:
@@ -1484,15 +1968,18 @@ class MainWindow(QMainWindow):
             if layer:
                 self.state.fit_layer_to_hoop(layer)
 
-    @Slot()
-    def _on_layer_align(self):
-        """Slot to align the selected layer based on the triggered action."""
-        s = self.sender()
-        if self.state is None or self.state.selected_layer is None:
+    def _on_layer_align(self, align: LayerAlign) -> None:
+        """
+        Aligns the selected layer. Called when one of the align actions is triggered.
+
+        Args:
+            align: How to align the layer.
+        """
+        state = self.state
+        if state is None or state.selected_layer is None:
             return
-        x, y = self.state.selected_layer.calculate_pos_for_align(s.data(), self.state.hoop_size)
-        self._position_x_spinbox.setValue(x)
-        self._position_y_spinbox.setValue(y)
+        x, y = state.selected_layer.calculate_pos_for_align(align, state.hoop_size)
+        self._set_editor_position(x, y)
 
     @Slot()
     def _on_zoom_in(self):
@@ -1518,7 +2005,7 @@ class MainWindow(QMainWindow):
         if self.canvas and self.state:
             self.canvas.zoom_fit()
 
-    @Slot()
+    @Slot(QListWidgetItem, QListWidgetItem)
     def _on_layer_current_item_changed(
         self, current: QListWidgetItem, previous: QListWidgetItem
     ) -> None:
@@ -1532,43 +2019,45 @@ class MainWindow(QMainWindow):
             previous: The previously selected layer item.
         """
         # Gets triggered when a new layers gets selected. Might happen when an entry gets removed.
-        enabled = current is not None and self.state is not None and len(self.state.layers) > 0
+        # Apply pending edits before the editor gets repopulated with the new layer.
+        self._flush_pending_property_update()
+        state = self.state
+        # state.layers copies the list: only use it for the (unexpected) fallback
+        layer = None
+        if current is not None and state is not None:
+            layer = state.get_layer_for_uuid(current.data(Qt.UserRole))
+            if layer is None and state.layers:
+                layer = state.layers[-1]
+        enabled = layer is not None
         self._property_editor.setEnabled(enabled)
         self._embroidery_params_editor.setEnabled(enabled)
         if enabled:
-            layer_uuid = current.data(Qt.UserRole)
-            layer = self.state.get_layer_for_uuid(layer_uuid)
-            if not layer:
-                layer = self.state.layers[-1]
-
-            self.state.selected_layer_uuid = layer.uuid
+            state.selected_layer_uuid = layer.uuid
             self._populate_partitions(layer)
             self._populate_property_editor(layer.properties)
             self._populate_embroidery_editor(layer.embroidery_params)
         else:
-            if self.state is not None:
-                self.state.selected_layer_uuid = None
+            if state is not None:
+                state.selected_layer_uuid = None
 
-        self._update_qactions()
+        self._schedule_update_qactions()
 
-    @Slot()
+    @Slot(QModelIndex, int, int, QModelIndex)
     def _on_layer_rows_moved(self, parent, start, end, destination):
         """Slot for when layers are reordered in the layer list."""
         if self.state is None:
             logger.warning("Cannot reorder layers, no active state")
             return
-        layers = self.state.layers
+        by_uuid = {layer.uuid: layer for layer in self.state.layers}
         new_layers = []
+        role = Qt.UserRole
         for row in range(self._layer_list.count()):
-            item = self._layer_list.item(row)
-            layer_uuid = item.data(Qt.UserRole)
-            for layer in layers:
-                if layer.uuid == layer_uuid:
-                    new_layers.append(layer)
-                    break
+            layer = by_uuid.get(self._layer_list.item(row).data(role))
+            if layer is not None:
+                new_layers.append(layer)
         self.state.reorder_layers(new_layers)
 
-    @Slot()
+    @Slot(QListWidgetItem)
     def _on_layer_item_double_clicked(self, item: QListWidgetItem):
         """
         Slot for when a layer item is double-clicked.
@@ -1598,13 +2087,16 @@ class MainWindow(QMainWindow):
         if self.state is None:
             return
 
-        enabled = current is not None
         selected_layer = self.state.selected_layer
+        row = self._partition_list.currentRow()
         new_uuid = None
-        if enabled:
-            new_uuid = current.data(Qt.UserRole)
+        if current is not None and 0 <= row < len(self._partition_keys):
+            new_uuid = self._partition_keys[row]
 
         if selected_layer is not None:
+            if selected_layer.selected_partition_uuid == new_uuid:
+                # e.g. the list re-selecting the current partition after being repopulated
+                return
             # Sanity check: ensure the new_uuid belongs to the selected layer
             # This prevents ValueErrors if the UI is out of sync with the model
             if new_uuid is None or new_uuid in selected_layer.partitions:
@@ -1612,7 +2104,6 @@ class MainWindow(QMainWindow):
 
         if self.canvas:
             self.canvas.update()
-        self.update()
 
     @Slot(QListWidgetItem)
     def _on_partition_item_double_clicked(self, current: QListWidgetItem) -> None:
@@ -1629,9 +2120,10 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_partition_edit(self):
         """Slot to open the partition editor for the selected partition."""
-        if self.state is None:
+        state = self.state
+        if state is None:
             return
-        layer = self.state.selected_layer
+        layer = state.selected_layer
         if layer is None:
             return
 
@@ -1639,10 +2131,12 @@ class MainWindow(QMainWindow):
         if partition is None:
             return
 
+        from partition_dialog import PartitionDialog
+
         dialog = PartitionDialog(layer.image, partition)
         if dialog.exec():
             route = dialog.get_route()
-            self.state.update_partition_route(layer, partition, route)
+            state.update_partition_route(layer, partition, route)
             partition.route = route
 
     @Slot()
@@ -1667,14 +2161,12 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_partition_reorder(self):
         """Slot to reorder partitions based on distance from background color."""
-        if self.state is None or self.state.selected_layer is None:
+        state = self.state
+        layer = state.selected_layer if state is not None else None
+        if layer is None or len(layer.partitions) == 0:
             return
 
-        layer = self.state.selected_layer
-        if len(layer.partitions) == 0:
-            return
-
-        bg_color = QColor(self.state.canvas_background_color)
+        bg_color = QColor(state.canvas_background_color)
         bg = Color(bg_color.name())
 
         # Sort partitions by distance from background color
@@ -1686,28 +2178,31 @@ class MainWindow(QMainWindow):
         )
 
         new_partitions = {k: v for k, v in sorted_items}
-        self.state.update_layer_partitions(layer, new_partitions)
+        state.update_layer_partitions(layer, new_partitions)
 
-    @Slot()
+    @Slot(QModelIndex, int, int, QModelIndex)
     def _on_partition_rows_moved(self, parent, start, end, destination):
         """Slot for when partitions are reordered in the partition list."""
-        if self.state is None or self.state.selected_layer is None:
+        state = self.state
+        layer = state.selected_layer if state is not None else None
+        if layer is None:
             logger.warning("Cannot reorder partitions, no layer selected")
             return
-        layer = self.state.selected_layer
         partitions = layer.partitions
 
         # reorder dict keys. Dictionary maintains order
-        new_partitions = {}
-        for row in range(self._partition_list.count()):
-            item = self._partition_list.item(row)
-            partition_uuid = item.data(Qt.UserRole)
-            new_partitions[partition_uuid] = partitions[partition_uuid]
-        self.state.update_layer_partitions(layer, new_partitions)
+        role = Qt.UserRole
+        self._partition_keys = [
+            self._partition_list.item(row).data(role) for row in range(self._partition_list.count())
+        ]
+        new_partitions = {key: partitions[key] for key in self._partition_keys}
+        state.update_layer_partitions(layer, new_partitions)
 
     @Slot()
     def _on_pixel_width_changed(self) -> None:
         """Slot for when the pixel width changes."""
+        if self._suppress_property_slots:
+            return
         width = self._pixel_width_spinbox.value()
         mode = self._pixel_aspect_ratio_combo.currentText()
         if mode != "Freeform":
@@ -1725,6 +2220,8 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_pixel_aspect_ratio_changed(self) -> None:
         """Slot for when the pixel aspect ratio mode changes."""
+        if self._suppress_property_slots:
+            return
         mode = self._pixel_aspect_ratio_combo.currentText()
         width = self._pixel_width_spinbox.value()
 
@@ -1744,29 +2241,98 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_update_layer_property(self) -> None:
-        """Slot to update the selected layer's properties from the property editor."""
-        enabled = self.state is not None and self.state.selected_layer is not None
+        """
+        Slot to update the selected layer's properties from the property editor.
+
+        The update is deferred for a few milliseconds, so that dragging a slider or spinning a
+        spin box applies one update per frame instead of one per intermediate value.
+        """
+        if self._suppress_property_slots:
+            return
+        state = self.state
+        layer = state.selected_layer if state is not None else None
+        enabled = layer is not None
         self._property_editor.setEnabled(enabled)
         if enabled:
-            properties = LayerProperties(
-                position=(self._position_x_spinbox.value(), self._position_y_spinbox.value()),
-                rotation=self._rotation_slider.value(),
-                pixel_size=(self._pixel_width_spinbox.value(), self._pixel_height_spinbox.value()),
-                visible=self._visible_checkbox.isChecked(),
-                opacity=self._opacity_slider.value() / 100.0,
-                name=self._name_edit.text(),
-                pixel_aspect_ratio_mode=self._pixel_aspect_ratio_combo.currentText(),
-            )
-            self.state.set_layer_properties(self.state.selected_layer, properties)
+            self._pending_property_target = (state, layer)
+            # Throttle, not debounce: don't restart the timer, so that a continuous drag still
+            # updates the layer once per frame. The update reads the latest widget values.
+            if not self._property_update_timer.isActive():
+                self._property_update_timer.start()
+
+    @Slot()
+    def _flush_pending_property_update(self) -> None:
+        """Applies the deferred property update right away, if there is one."""
+        if self._property_update_timer.isActive():
+            self._property_update_timer.stop()
+            self._flush_property_update()
+
+    @Slot()
+    def _flush_property_update(self) -> None:
+        """Applies the property editor values to the layer recorded by _on_update_layer_property."""
+        if self._pending_property_target is None:
+            return
+        state, layer = self._pending_property_target
+        self._pending_property_target = None
+        if state.get_layer_for_uuid(layer.uuid) is not layer:
+            # Layer was deleted in the meantime
+            return
+        self._apply_layer_property(state, layer)
+
+    def _apply_layer_property(self, state: State, layer: Layer) -> None:
+        """
+        Updates the layer's properties with the values from the property editor.
+
+        Args:
+            state: The state that owns the layer.
+            layer: The layer to update.
+        """
+        properties = LayerProperties(
+            position=(self._position_x_spinbox.value(), self._position_y_spinbox.value()),
+            rotation=self._rotation_slider.value(),
+            pixel_size=(self._pixel_width_spinbox.value(), self._pixel_height_spinbox.value()),
+            visible=self._visible_checkbox.isChecked(),
+            opacity=self._opacity_slider.value() / 100.0,
+            name=self._name_edit.text(),
+            pixel_aspect_ratio_mode=self._pixel_aspect_ratio_combo.currentText(),
+        )
+        if properties == layer.properties:
+            # e.g. a slider dragged back to where it started: nothing to undo nor to repaint
+            return
+        state.set_layer_properties(layer, properties)
+        self._schedule_canvas_relayout()
+
+    def _schedule_canvas_relayout(self) -> None:
+        """
+        Recalculates the size of the active canvas and repaints it, once the control returns
+        to the event loop.
+
+        A single user action (e.g. deleting a layer) can trigger several slots that need it.
+        They all get coalesced into one.
+        """
+        canvas = self.canvas
+        if canvas is None:
+            return
+        if not self._canvases_to_relayout:
+            QTimer.singleShot(0, self._relayout_canvases)
+        self._canvases_to_relayout.add(canvas)
 
-            if self.canvas:
-                self.canvas.recalculate_fixed_size()
-            self.update()
+    @Slot()
+    def _relayout_canvases(self) -> None:
+        """Recalculates the size of the canvases scheduled by _schedule_canvas_relayout."""
+        canvases = self._canvases_to_relayout
+        self._canvases_to_relayout = set()
+        for canvas in canvases:
+            # Repaints the canvas too
+            canvas.recalculate_fixed_size()
 
     @Slot()
     def _on_update_embroidery_property(self) -> None:
         """Slot to update the selected layer's embroidery parameters from the editor."""
-        selected_layer = self.state.selected_layer
+        if self._suppress_property_slots:
+            return
+        state = self.state
+        selected_layer = state.selected_layer if state is not None else None
         enabled = selected_layer is not None
         self._embroidery_params_editor.setEnabled(enabled)
         if enabled:
@@ -1779,8 +2345,10 @@ class MainWindow(QMainWindow):
                 fill_method=self._fill_method_combo.currentData(),
                 fill_underlay=self._fill_underlay_checkbox.isChecked(),
             )
-            selected_layer.embroidery_params = embroidery_params
+            if embroidery_params != selected_layer.embroidery_params:
+                selected_layer.embroidery_params = embroidery_params
 
+    @Slot()
     def _update_embroidery_ui_state(self):
         """Updates the enabled state of embroidery widgets based on the selected fill method."""
         fill_method = self._fill_method_combo.currentData()
@@ -1791,6 +2359,8 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_show_about_dialog(self) -> None:
         """Slot to show the 'About' dialog."""
+        from about_dialog import AboutDialog
+
         dialog = AboutDialog()
         dialog.exec()
 
@@ -1802,20 +2372,25 @@ class MainWindow(QMainWindow):
         Args:
             position: The new position of the layer.
         """
-        # Avoid sending two Undo commands if only one can do it
-        x = self._position_x_spinbox.value()
-        y = self._position_y_spinbox.value()
-        if position.x() == x and position.y() == y:
+        self._set_editor_position(position.x(), position.y())
+
+    def _set_editor_position(self, x: float, y: float) -> None:
+        """
+        Updates both position spin boxes and applies them to the selected layer in one step.
+
+        Args:
+            x: The new X position in mm.
+            y: The new Y position in mm.
+        """
+        if self._position_x_spinbox.value() == x and self._position_y_spinbox.value() == y:
             return
-        if position.x() == x and position.y() != y:
-            self._position_y_spinbox.setValue(position.y())
-        elif position.x() != x and position.y() == y:
-            self._position_x_spinbox.setValue(position.x())
-        else:
-            # Both X and Y are different. Block signals on one to avoid triggering two "updates"
-            with block_signals(self._position_y_spinbox):
-                self._position_y_spinbox.setValue(position.y())
-                self._position_x_spinbox.setValue(position.x())
+        # Block both spin boxes so that only one property update (and Undo command) is generated
+        with block_signals((self._position_x_spinbox, self._position_y_spinbox)):
+            self._position_x_spinbox.setValue(x)
+            self._position_y_spinbox.setValue(y)
+        # Not a "storm": apply it immediately, together with any pending update
+        self._on_update_layer_property()
+        self._flush_pending_property_update()
 
     @Slot(object, object, object, object)
     def _on_canvas_cursor_position_changed(
@@ -1838,11 +2413,11 @@ class MainWindow(QMainWindow):
         Args:
             layer_uuid: The UUID of the newly selected layer.
         """
-        for i in range(self._layer_list.count()):
-            item = self._layer_list.item(i)
-            if item.data(Qt.UserRole) == layer_uuid:
-                self._layer_list.setCurrentRow(i)
-                break
+        if self.state is None:
+            return
+        row = self.state.get_layer_index(layer_uuid)
+        if row >= 0:
+            self._layer_list.setCurrentRow(row)
 
     @Slot(str)
     def _on_canvas_layer_double_clicked(self, layer_uuid: str):
@@ -1856,7 +2431,7 @@ class MainWindow(QMainWindow):
             return
         self._process_double_click_on_layer(layer_uuid)
 
-    @Slot()
+    @Slot(Layer)
     def _on_state_layer_property_changed(self, layer: Layer):
         """
         Slot for when a layer's properties change in the application state.
@@ -1869,6 +2444,9 @@ class MainWindow(QMainWindow):
             return
 
         if self.state.selected_layer == layer:
+            if layer.properties == self._last_properties_shown:
+                # Nothing changed since the editor was populated. e.g.: undo / redo round trips
+                return
             self._populate_property_editor(layer.properties)
 
             # Update Layer Name. Could have been changed from the editor
@@ -1880,12 +2458,10 @@ class MainWindow(QMainWindow):
             # Probably to an "undo" command.
             pass
 
-        self._update_qactions()
-        if self.canvas:
-            self.canvas.recalculate_fixed_size()
-        self.update()
+        self._schedule_update_qactions()
+        self._schedule_canvas_relayout()
 
-    @Slot()
+    @Slot(StatePropertyFlags, StateProperties)
     def _on_state_state_property_changed(
         self, flag: StatePropertyFlags, properties: StateProperties
     ):
@@ -1920,13 +2496,11 @@ class MainWindow(QMainWindow):
                 self.canvas.on_preferences_updated()
 
             if flag == StatePropertyFlags.HOOP_SIZE or flag == StatePropertyFlags.ZOOM_FACTOR:
-                self.canvas.recalculate_fixed_size()
-                self.canvas.update()
-                self.update()
+                self._schedule_canvas_relayout()
             else:
                 self.canvas.update()
 
-    @Slot()
+    @Slot(Layer)
     def _on_state_layer_added(self, layer: Layer):
         """
         Slot for when a layer is added to the application state.
@@ -1939,31 +2513,17 @@ class MainWindow(QMainWindow):
         with block_signals(self._layer_list):
             self._layer_list.addItem(item)
 
-        with block_signals(self._partition_list):
-            for partition_key, partition in layer.partitions.items():
-                item = QListWidgetItem(partition.name)
-                item.setData(Qt.UserRole, partition_key)
-
-                # Create a solid color icon swatch
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(QColor(partition.color))
-                item.setIcon(QIcon(pixmap))
-
-                self._partition_list.addItem(item)
-
-        # Order matters: first layer, then partition
-        # Triggers on_layer_item_changed
-        self._layer_list.setCurrentRow(len(self.state.layers) - 1)
-        # Triggers on_change_partition
+        # Order matters: first partition, then layer.
+        # Select the partition in the layer, since the partition list might not be populated
         if len(layer.partitions) > 0:
-            self._partition_list.setCurrentRow(0)
+            layer.selected_partition_uuid = next(iter(layer.partitions))
+        # Triggers on_layer_item_changed, which populates the partition list
+        self._layer_list.setCurrentRow(self.state.get_layer_index(layer.uuid))
 
-        self._update_statusbar()
-        if self.canvas:
-            self.canvas.recalculate_fixed_size()
-        self.update()
+        self._schedule_update_statusbar()
+        self._schedule_canvas_relayout()
 
-    @Slot()
+    @Slot(Layer)
     def _on_state_layer_removed(self, layer: Layer):
         """
         Slot for when a layer is removed from the application state.
@@ -1972,25 +2532,22 @@ class MainWindow(QMainWindow):
             layer: The removed layer.
         """
         # Clear the "partitions"
-        with block_signals(self._partition_list):
-            self._partition_list.clear()
+        self._clear_partition_list()
 
-        # Remove it from the widget
-        index = -1
-        for index in range(self._layer_list.count()):
-            item = self._layer_list.item(index)
-            if item.data(Qt.UserRole) == layer.uuid:
+        # Remove it from the widget. The layer is no longer in the state, so its row can't be
+        # looked up with get_layer_index(). takeItem() is linear anyway.
+        role = Qt.UserRole
+        for row in range(self._layer_list.count()):
+            if self._layer_list.item(row).data(role) == layer.uuid:
+                # Triggers "_on_layer_current_item_changed"
+                self._layer_list.takeItem(row)
                 break
-        if index != -1:
-            # Triggers "_on_layer_current_item_changed"
-            self._layer_list.takeItem(index)
         else:
             logger.warning(f"Failed to delete layer from list {layer.name}")
 
         # _partition_list should get auto-populated
         # by _on_layer_current_item_changed
-        if self.canvas:
-            self.canvas.recalculate_fixed_size()
+        self._schedule_canvas_relayout()
 
     @Slot(Layer)
     def _on_state_layer_partitions_changed(self, layer: Layer):
@@ -2005,10 +2562,8 @@ class MainWindow(QMainWindow):
         self._populate_partitions(layer)
         # because a "_on_layer_current_item_changed" should be triggered by "_layer_list.takeItem()"
 
-        self._update_statusbar()
-        if self.canvas:
-            self.canvas.recalculate_fixed_size()
-            self.canvas.update()
+        self._schedule_update_statusbar()
+        self._schedule_canvas_relayout()
 
     @Slot()
     def _on_state_layers_reordered(self):
@@ -2018,7 +2573,7 @@ class MainWindow(QMainWindow):
         # Save selection
         selected_uuid = self.state.selected_layer_uuid
 
-        with block_signals(self._layer_list):
+        with updates_disabled(self._layer_list), block_signals(self._layer_list):
             self._layer_list.clear()
             for layer in self.state.layers:
                 item = self._create_layer_list_item(layer)
@@ -2039,13 +2594,15 @@ class MainWindow(QMainWindow):
             layer: The layer containing the partition.
             partition: The partition whose route was updated.
         """
+        # The number of pixels of the partition might have changed
+        self._schedule_update_statusbar()
         if self.state.selected_layer != layer:
             return
         # No need to update the list, just the canvas
         if self.canvas:
             self.canvas.update()
 
-    @Slot()
+    @Slot(Layer)
     def _on_state_layer_pixels_changed(self, layer: Layer):
         """
         Slot for when a layer's pixel data has changed.
@@ -2053,20 +2610,16 @@ class MainWindow(QMainWindow):
         Args:
             layer: The layer whose pixels have changed.
         """
-        for i in range(self._layer_list.count()):
-            item = self._layer_list.item(i)
-            if item.data(Qt.UserRole) == layer.uuid:
-                self._update_layer_list_item_icon(item, layer)
-                break
+        item = self._layer_list.item(self.state.get_layer_index(layer.uuid))
+        if item is not None:
+            self._update_layer_list_item_icon(item, layer)
 
         item = self._layer_list.currentItem()
         if item and item.data(Qt.UserRole) == layer.uuid:
             self._populate_partitions(layer)
 
-        self._update_statusbar()
-        if self.canvas:
-            self.canvas.recalculate_fixed_size()
-        self.update()
+        self._schedule_update_statusbar()
+        self._schedule_canvas_relayout()
 
     @Slot()
     def _on_canvas_mode_move(self):
@@ -2076,6 +2629,8 @@ class MainWindow(QMainWindow):
             self.canvas.mode = Canvas.Mode.MOVE
 
     def _edit_layer_pixels(self, layer: ImageLayer):
+        from pixel_editor_dialog import PixelEditorDialog
+
         dialog = PixelEditorDialog(layer.image, self)
         if dialog.exec() == QDialog.Accepted:
             new_image = dialog.get_image()
@@ -2123,8 +2678,12 @@ class MainWindow(QMainWindow):
 
         # Add undo stack to group
         self._undo_group.addStack(doc.state.undo_stack)
-        doc.state.undo_stack.indexChanged.connect(self._on_undo_stack_index_changed)
-        doc.state.undo_stack.cleanChanged.connect(lambda: self._on_document_clean_changed(doc))
+        doc.state.undo_stack.indexChanged.connect(
+            self._on_undo_stack_index_changed, Qt.UniqueConnection
+        )
+        doc.state.undo_stack.cleanChanged.connect(
+            functools.partial(self._on_document_clean_changed, doc)
+        )
 
         self._update_tab_title(self._tab_widget.indexOf(doc))
 
@@ -2135,43 +2694,72 @@ class MainWindow(QMainWindow):
         Parses a layer's image in a background thread to generate partitions,
         keeping the UI responsive.
         """
-        from PySide6.QtCore import Qt, QThreadPool
+
+        def on_finished(partitions):
+            layer._partitions = partitions
+            callback(layer)
+
+        self._start_worker(ParseImageWorker(layer.image, background_color), on_finished)
+
+    def _load_image_layer_asynchronously(self, filename: str, background_color, callback):
+        """
+        Decodes an image file into an ImageLayer and generates its partitions in a background
+        thread. Large images can take a while to decode, so this is kept off the UI thread too.
+
+        Args:
+            filename: The image file to load.
+            background_color: The color to ignore when generating the partitions.
+            callback: Called in the UI thread with the new layer.
+        """
+        self._start_worker(LoadImageLayerWorker(filename, background_color), callback)
+
+    def _start_worker(self, worker, on_finished):
+        """
+        Starts a worker in the global thread pool, disabling the UI until it finishes.
+
+        Args:
+            worker: A QRunnable with "finished" and "error" signals.
+            on_finished: Called in the UI thread with the result of the worker.
+        """
+        from PySide6.QtCore import QThreadPool
 
         self.statusBar().showMessage(self.tr("Analyzing image..."))
         self.setEnabled(False)
 
-        worker = ParseImageWorker(layer.image, background_color)
         self._active_workers.add(worker)
 
-        def on_finished(partitions):
+        def finished(result):
             self._active_workers.discard(worker)
-            layer._partitions = partitions
             self.statusBar().clearMessage()
             self.setEnabled(True)
-            callback(layer)
+            on_finished(result)
 
-        def on_error(err):
+        def error(err):
             self._active_workers.discard(worker)
             self.statusBar().showMessage(self.tr("Error analyzing image: ") + str(err), 5000)
             self.setEnabled(True)
 
-        worker.signals.finished.connect(on_finished, Qt.QueuedConnection)
-        worker.signals.error.connect(on_error, Qt.QueuedConnection)
+        worker.signals.finished.connect(finished, Qt.QueuedConnection)
+        worker.signals.error.connect(error, Qt.QueuedConnection)
         QThreadPool.globalInstance().start(worker)
 
+    @Slot(int)
     def _on_tab_close_requested(self, index: int):
         widget = self._tab_widget.widget(index)
         if isinstance(widget, Document):
             if self._maybe_abort_operation_if_dirty(widget):
                 return
             self._undo_group.removeStack(widget.state.undo_stack)
+            self._canvases_to_relayout.discard(widget.canvas)
             self._tab_widget.removeTab(index)
             widget.deleteLater()
             # If no tabs left, update UI
             if self._tab_widget.count() == 0:
                 pass
 
+    @Slot(int)
     def _on_current_document_changed(self, index: int):
+        self._flush_pending_property_update()
         # Disconnect previous
         if self._connected_doc:
             self._disconnect_document_signals(self._connected_doc)
@@ -2182,50 +2770,47 @@ class MainWindow(QMainWindow):
             self._connect_document_signals(doc)
             self._connected_doc = doc
             self._undo_group.setActiveStack(doc.state.undo_stack)
-            self._undo_view.setStack(doc.state.undo_stack)  # Update undo view for active stack
 
         self._update_window_title()
-        self._update_qactions()
-        self._update_statusbar()
+        self._schedule_update_qactions()
+        self._schedule_update_statusbar()
         self._refresh_docks()
 
         # Ensure canvas has focus if possible, or update other UI related to active canvas
 
     def _refresh_docks(self):
         """Refreshes all docks based on the current active state."""
-        with block_signals(self._layer_list):
-            self._layer_list.clear()
-        with block_signals(self._partition_list):
-            self._partition_list.clear()
+        state = self.state
+        selected_layer = None
 
-        if self.state:
-            # Populate Layers
-            selected_layer = self.state.selected_layer
-            with block_signals(self._layer_list):
-                for layer in self.state.layers:
+        # Repopulating the lists must not trigger their "current item changed" slots
+        with updates_disabled((self._layer_list, self._partition_list)), block_signals(
+            (self._layer_list, self._partition_list)
+        ):
+            self._layer_list.clear()
+            self._clear_partition_list()
+
+            if state:
+                selected_layer = state.selected_layer
+                # Ensure a layer is selected if possible
+                if not selected_layer and state.layers:
+                    # Default to the top layer (last in list)
+                    selected_layer = state.layers[-1]
+                    state.selected_layer_uuid = selected_layer.uuid
+
+                # Populate Layers
+                for layer in state.layers:
                     item = self._create_layer_list_item(layer)
                     self._layer_list.addItem(item)
-                    if selected_layer and layer.uuid == selected_layer.uuid:
+                    if layer is selected_layer:
                         self._layer_list.setCurrentItem(item)
 
-            # Ensure a layer is selected if possible
-            if not selected_layer and self.state.layers:
-                # Default to the top layer (last in list)
-                selected_layer = self.state.layers[-1]
-                self.state.selected_layer_uuid = selected_layer.uuid
-
-                # Update UI selection to match
-                # Find the item corresponding to this uuid
-                for i in range(self._layer_list.count()):
-                    item = self._layer_list.item(i)
-                    if item.data(Qt.UserRole) == selected_layer.uuid:
-                        with block_signals(self._layer_list):
-                            self._layer_list.setCurrentItem(item)
-                        break
+                # Populate Partitions
+                if selected_layer:
+                    self._populate_partitions(selected_layer)
 
-            # Populate Partitions (triggered by selection or manual)
+        if state:
             if selected_layer:
-                self._populate_partitions(selected_layer)
                 # Since signals were blocked, we must manually update the UI for the selected layer
                 self._property_editor.setEnabled(True)
                 self._embroidery_params_editor.setEnabled(True)
@@ -2236,7 +2821,7 @@ class MainWindow(QMainWindow):
                 self._embroidery_params_editor.setEnabled(False)
 
         # Update properties dock state
-        self._update_qactions()
+        self._schedule_update_qactions()
 
     def setup_mcp_bridge(self, bridge):
         self._mcp_bridge = bridge
@@ -2778,6 +3363,76 @@ class ParseImageWorker(QRunnable):
             self.signals.error.emit(str(e))
 
 
+class LoadImageLayerWorkerSignals(QObject):
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class LoadImageLayerWorker(QRunnable):
+    def __init__(self, filename: str, bg_color: QColor | None):
+        super().__init__()
+        self.filename = filename
+        self.bg_color = bg_color
+        self.signals = LoadImageLayerWorkerSignals()
+
+    def run(self):
+        try:
+            from image_parser import ImageParser
+
+            layer = ImageLayer(self.filename)
+            if layer.image.isNull():
+                raise ValueError(f"Invalid image: {self.filename}")
+            parser = ImageParser(layer.image, self.bg_color)
+            layer._partitions = parser.partitions
+            self.signals.finished.emit(layer)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class SaveProjectWorkerSignals(QObject):
+    finished = Signal(bool)
+
+
+class SaveProjectWorker(QRunnable):
+    def __init__(self, project: dict, filename: str):
+        super().__init__()
+        self.project = project
+        self.filename = filename
+        self.signals = SaveProjectWorkerSignals()
+
+    def run(self):
+        self.signals.finished.emit(State.write_dict_to_filename(self.project, self.filename))
+
+
+class ExportPngWorkerSignals(QObject):
+    finished = Signal(bool)
+
+
+class ExportPngWorker(QRunnable):
+    def __init__(self, image: QImage, filename: str):
+        super().__init__()
+        self.image = image
+        self.filename = filename
+        self.signals = ExportPngWorkerSignals()
+
+    def run(self):
+        self.signals.finished.emit(State.write_image_to_png(self.image, self.filename))
+
+
+class FileExistsWorkerSignals(QObject):
+    finished = Signal(bool)
+
+
+class FileExistsWorker(QRunnable):
+    def __init__(self, filename: str):
+        super().__init__()
+        self.filename = filename
+        self.signals = FileExistsWorkerSignals()
+
+    def run(self):
+        self.signals.finished.emit(os.path.exists(self.filename))
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("Pixem")
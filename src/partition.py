@@ -23,6 +23,9 @@ class Partition:
         coord: tuple[int, int]
         dir: str
 
+    # Projects can have thousands of partitions: avoid a __dict__ per instance
+    __slots__ = ("_route", "_name", "_color")
+
     def __init__(self, route: list[Shape], name: str | None = None, color: str | None = None):
         # FIXME Remove me: Sanity check
         for shape in route:
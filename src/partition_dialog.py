@@ -18,7 +18,6 @@ from PySide6.QtGui import (
     QAction,
     QColor,
     QGuiApplication,
-    QIcon,
     QImage,
     QKeyEvent,
     QKeySequence,
@@ -45,7 +44,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from image_utils import create_icon_from_svg
+from image_utils import create_icon_from_svg, create_icon_from_theme
 from partition import Partition
 from path_finder import PathFinder
 from preferences import get_global_preferences
@@ -980,7 +979,7 @@ class PartitionDialog(QDialog):
             ),
         ]
         for text, icon_name, key_sequence, slot in zoom_actions:
-            action = QAction(QIcon.fromTheme(icon_name), text, self)
+            action = QAction(create_icon_from_theme(icon_name), text, self)
             action.setShortcut(key_sequence)
             toolbar.addAction(action)
             action.triggered.connect(slot)
@@ -1010,12 +1009,12 @@ class PartitionDialog(QDialog):
 
         undo_action = self._undo_stack.createUndoAction(self, self.tr("Undo"))
         undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.setIcon(QIcon.fromTheme("edit-undo"))
+        undo_action.setIcon(create_icon_from_theme("edit-undo"))
         toolbar.addAction(undo_action)
 
         redo_action = self._undo_stack.createRedoAction(self, self.tr("Redo"))
         redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.setIcon(QIcon.fromTheme("edit-redo"))
+        redo_action.setIcon(create_icon_from_theme("edit-redo"))
         toolbar.addAction(redo_action)
 
         # Create Buttons
@@ -38,7 +38,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from image_utils import create_icon_from_svg
+from image_utils import create_icon_from_svg, create_icon_from_theme
 
 logger = logging.getLogger(__name__)
 
@@ -420,12 +420,12 @@ class PixelEditorDialog(QDialog):
         # Undo/Redo
         undo_action = self._undo_stack.createUndoAction(self, self.tr("Undo"))
         undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.setIcon(QIcon.fromTheme("edit-undo"))
+        undo_action.setIcon(create_icon_from_theme("edit-undo"))
         toolbar.addAction(undo_action)
 
         redo_action = self._undo_stack.createRedoAction(self, self.tr("Redo"))
         redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.setIcon(QIcon.fromTheme("edit-redo"))
+        redo_action.setIcon(create_icon_from_theme("edit-redo"))
         toolbar.addAction(redo_action)
 
         # Buttons
@@ -29,6 +29,9 @@ class Preferences(QObject):
         super().__init__()
         self._settings = QSettings()
         self._recent_files = []
+        # Cached to avoid hitting QSettings every time a new State is created.
+        # Only set_hoop_size() is allowed to modify it.
+        self._hoop_size = None
 
         self._load_recent_files()
 
@@ -74,12 +77,15 @@ class Preferences(QObject):
         if current[0] != size[0] or current[1] != size[1]:
             self._settings.setValue("hoop/size_x", size[0])
             self._settings.setValue("hoop/size_y", size[1])
+            self._hoop_size = (float(size[0]), float(size[1]))
             self.hoop_size_changed.emit(size)
 
     def get_hoop_size(self) -> tuple[float, float]:
-        x = float(self._settings.value("hoop/size_x", defaultValue=4))
-        y = float(self._settings.value("hoop/size_y", defaultValue=4))
-        return x, y
+        if self._hoop_size is None:
+            x = float(self._settings.value("hoop/size_x", defaultValue=4))
+            y = float(self._settings.value("hoop/size_y", defaultValue=4))
+            self._hoop_size = (x, y)
+        return self._hoop_size
 
     def get_hoop_color_name(self) -> str:
         return str(self._settings.value("hoop/foreground_color", defaultValue="#c0c0c0ff"))
@@ -91,7 +97,8 @@ class Preferences(QObject):
             self.canvas_hoop_color_changed.emit(color)
 
     def set_open_file_on_startup(self, value: bool) -> None:
-        self._settings.setValue("files/open_file_on_startup", value)
+        if self.get_open_file_on_startup() != value:
+            self._settings.setValue("files/open_file_on_startup", value)
 
     def get_open_file_on_startup(self) -> bool:
         return bool(self._settings.value("files/open_file_on_startup", defaultValue=True))
@@ -140,7 +147,8 @@ class Preferences(QObject):
         return str(self._settings.value("partition/foreground_color", defaultValue="#800000ff"))
 
     def set_partition_foreground_color_name(self, color: str):
-        self._settings.setValue("partition/foreground_color", color)
+        if self.get_partition_foreground_color_name() != color:
+            self._settings.setValue("partition/foreground_color", color)
 
     def get_partition_background_color_name(self) -> str:
         return str(self._settings.value("partition/background_color", defaultValue="#80ff0000"))
@@ -215,7 +223,8 @@ class Preferences(QObject):
             self.snap_to_layers_changed.emit(snap)
 
     def set_delete_point_enabled(self, enabled: bool) -> None:
-        self._settings.setValue("partition/delete_point_enabled", enabled)
+        if self.get_delete_point_enabled() != enabled:
+            self._settings.setValue("partition/delete_point_enabled", enabled)
 
     def get_delete_point_enabled(self) -> bool:
         return bool(self._settings.value("partition/delete_point_enabled", defaultValue=False))
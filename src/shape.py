@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """Represents a point in 2D space.
 
@@ -26,6 +26,9 @@ class Shape(ABC):
     immutable can override this and implement their own __hash__.
     """
 
+    # No per-instance __dict__: routes hold one shape per pixel
+    __slots__ = ()
+
     __hash__ = None
 
     @abstractmethod
@@ -34,7 +37,7 @@ class Shape(ABC):
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect(Shape):
     """Represents an immutable point defined by its position in the grid.
     This point represents a Rect when exported to Ink/Stitch. That's why it is
@@ -53,6 +56,8 @@ class Rect(Shape):
 class Path(Shape):
     """Represents a mutable path composed of a sequence of points."""
 
+    __slots__ = ("_path",)
+
     def __init__(self, path: list[Point]):
         """Initializes the Path with a list of points.
 
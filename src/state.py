@@ -3,6 +3,8 @@
 
 import copy
 import logging
+import os
+from collections import Counter
 from dataclasses import asdict
 from typing import Self
 
@@ -66,6 +68,8 @@ class State(QObject):
     def __init__(self):
         super().__init__()
         self._project_filename = None
+        # Cached os.path.basename() of _project_filename, used by the window and tab titles
+        self._project_basename = None
         prefs = get_global_preferences()
         self._properties = StateProperties(
             hoop_size=prefs.get_hoop_size(),
@@ -79,6 +83,16 @@ class State(QObject):
             export_filename=None,
         )
         self._layers: dict[str, Layer] = {}
+        # Only increments. Used to generate default layer names that don't collide
+        # after layers get deleted.
+        self._layer_counter = 0
+        # uuid -> position in _layers. Built lazily, reset whenever the layers change.
+        self._layer_indices: dict[str, int] | None = None
+        # Project totals, updated as layers and partitions come and go. See statistics.
+        self._total_partitions = 0
+        self._total_pixels = 0
+        # Color -> number of partitions using it. Colors are removed when the count reaches 0.
+        self._color_counts: Counter[str] = Counter()
 
         self._undo_stack = QUndoStack()
 
@@ -89,8 +103,10 @@ class State(QObject):
         for key, value in dict_layers.items():
             layer = Layer.from_dict(value)
             state._layers[layer.uuid] = layer
+            state._update_statistics(layer, 1)
             if key != layer.uuid:
                 logger.error(f"Dictionary key {key} does not match layer UUID {layer.uuid}")
+        state._layer_counter = len(state._layers)
         if "properties" in d:
             # Handle backward compatibility:
             # Old files might miss some properties.
@@ -125,7 +141,7 @@ class State(QObject):
                     logger.error(f"Failed to load project from {filename}")
                     return None
                 state = cls.from_dict(d)
-                state._project_filename = filename
+                state._set_project_filename(filename)
                 return state
         except FileNotFoundError as e:
             logger.error(f"Could not load file from {filename}, error: {e}")
@@ -135,18 +151,47 @@ class State(QObject):
         logger.info(f"Saving project to filename {filename}")
         if filename is None:
             return
-        self._project_filename = filename
+        self._set_project_filename(filename)
+
+        if State.write_dict_to_filename(self.to_dict(), filename):
+            self._undo_stack.setClean()
+
+    @staticmethod
+    def write_dict_to_filename(d: dict, filename: str) -> bool:
+        """
+        Writes a project dictionary, as returned by to_dict(), to a file.
 
-        d = self.to_dict()
+        It doesn't touch any State, so it can be called from a worker thread.
 
+        Args:
+            d: The project dictionary.
+            filename: The file to write to.
+
+        Returns:
+            True if the file was written successfully.
+        """
         try:
             with open(filename, "w", encoding="utf-8") as f:
                 toml.dump(d, f)
-                self._undo_stack.setClean()
+            return True
         except FileNotFoundError as e:
             logger.error(f"Could not save file to {filename}, error: {e}")
         except Exception:
             logging.exception("An unexpected error occurred:")
+        return False
+
+    def mark_saved(self, filename: str, undo_index: int) -> None:
+        """
+        Records that the project was saved to a file.
+
+        Args:
+            filename: The file the project was saved to.
+            undo_index: The undo stack index at the time the project was serialized.
+                The stack is only marked as clean if nothing was done since then.
+        """
+        self._set_project_filename(filename)
+        if self._undo_stack.index() == undo_index:
+            self._undo_stack.setClean()
 
     def export_to_svg(self, filename: str) -> None:
         if len(self._layers) == 0:
@@ -163,6 +208,22 @@ class State(QObject):
     def export_to_png(self, filename: str, image: QImage) -> None:
         # FIXME: Ideally the state should be able to create the QImage itself.
         # But easier if it gets passed since, Canvas creates one easily.
+        State.write_image_to_png(image, filename)
+
+    @staticmethod
+    def write_image_to_png(image: QImage, filename: str) -> bool:
+        """
+        Writes an image, as rendered by the canvas, to a PNG file.
+
+        It doesn't touch any State, so it can be called from a worker thread.
+
+        Args:
+            image: The image to write.
+            filename: The file to write to.
+
+        Returns:
+            True if the file was written successfully.
+        """
         writer = QImageWriter(filename)
         writer.setFormat(QByteArray("PNG"))
         success = writer.write(image)
@@ -172,6 +233,12 @@ class State(QObject):
         else:
             error_string = writer.errorString()
             logger.error(f"Failed to save QImage to {filename}. Error: {error_string}")
+        return success
+
+    def next_layer_number(self) -> int:
+        """Returns the number to be used in the default name of a new layer."""
+        self._layer_counter += 1
+        return self._layer_counter
 
     def add_layer(self, layer: Layer) -> None:
         self._undo_stack.push(AddLayerCommand(self, layer, None))
@@ -221,6 +288,30 @@ class State(QObject):
             return self._layers[layer_uuid]
         return None
 
+    def get_layer_index(self, layer_uuid: str) -> int:
+        """
+        Returns the position of a layer in the layers list.
+
+        Args:
+            layer_uuid: The UUID of the layer.
+
+        Returns:
+            The index of the layer, or -1 if it does not belong to this state.
+        """
+        if self._layer_indices is None:
+            self._layer_indices = {uuid: i for i, uuid in enumerate(self._layers)}
+        return self._layer_indices.get(layer_uuid, -1)
+
+    @property
+    def statistics(self) -> tuple[int, int, int]:
+        """
+        Returns the project totals, without iterating over the layers.
+
+        Returns:
+            A (colors, partitions, pixels) tuple.
+        """
+        return len(self._color_counts), self._total_partitions, self._total_pixels
+
     def set_layer_properties(self, layer: Layer, properties: LayerProperties):
         if layer.uuid not in self._layers:
             logger.error(
@@ -386,6 +477,7 @@ class State(QObject):
         self._layers = {}
         for layer in layers:
             self._layers[layer.uuid] = layer
+        self._layer_indices = None
         self.layers_reordered.emit()
 
     def reorder_layers(self, layers: list[Layer]) -> None:
@@ -419,6 +511,11 @@ class State(QObject):
     def project_filename(self) -> str:
         return self._project_filename
 
+    @property
+    def project_basename(self) -> str | None:
+        """The file name of the project, without its directory. None if it was never saved."""
+        return self._project_basename
+
     @property
     def hoop_size(self) -> tuple[float, float]:
         return self._properties.hoop_size
@@ -494,6 +591,7 @@ class State(QObject):
         if partition not in layer.partitions.values():
             logger.error(f"Partition {partition.name} does not belong to layer {layer.name}")
             return
+        self._total_pixels += len(route) - partition.pixel_count
         partition.route = route
         self.partition_route_updated.emit(layer, partition)
 
@@ -503,17 +601,23 @@ class State(QObject):
                 f"Cannot update layer partitions. Layer {layer.name} does not belong to this state"
             )
             return
+        self._update_statistics(layer, -1)
         layer.partitions = partitions
+        self._update_statistics(layer, 1)
         self.layer_partitions_changed.emit(layer)
 
     def _add_layer(self, layer: Layer) -> None:
         self._layers[layer.uuid] = layer
+        self._layer_indices = None
+        self._update_statistics(layer, 1)
         self.selected_layer_uuid = layer.uuid
         self.layer_added.emit(layer)
 
     def _delete_layer(self, layer: Layer) -> None:
         try:
             del self._layers[layer.uuid]
+            self._layer_indices = None
+            self._update_statistics(layer, -1)
 
             # if there are no elements left, idx = -1
             if len(self._layers) > 0:
@@ -525,6 +629,27 @@ class State(QObject):
         except ValueError:
             logger.warning(f"Failed to remove layer, not  found {layer.name}")
 
+    def _set_project_filename(self, filename: str) -> None:
+        self._project_filename = filename
+        self._project_basename = os.path.basename(filename)
+
+    def _update_statistics(self, layer: Layer, sign: int) -> None:
+        """
+        Adds the partitions of a layer to the project totals, or removes them.
+
+        Args:
+            layer: The layer whose partitions are added or removed.
+            sign: 1 to add them, -1 to remove them.
+        """
+        partitions = layer.partitions.values()
+        self._total_partitions += sign * len(partitions)
+        self._total_pixels += sign * sum(p.pixel_count for p in partitions)
+        colors = Counter(p.color for p in partitions)
+        if sign > 0:
+            self._color_counts += colors
+        else:
+            self._color_counts -= colors
+
     def _set_hoop_size(self, hoop_size: tuple[float, float]) -> None:
         self._properties.hoop_size = hoop_size
         self.state_property_changed.emit(StatePropertyFlags.HOOP_SIZE, self.properties)
@@ -604,7 +729,9 @@ class State(QObject):
                 f"Cannot update text layer. Layer {new_layer.name} does not belong to this state"
             )
             return
+        self._update_statistics(self._layers[new_layer.uuid], -1)
         self._layers[new_layer.uuid] = new_layer
+        self._update_statistics(new_layer, 1)
         self.layer_pixels_changed.emit(new_layer)
 
     def _update_layer_image_and_partitions(
@@ -615,6 +742,8 @@ class State(QObject):
                 f"Cannot update layer image/partitions. Layer {layer.name} does not belong to this state"
             )
             return
+        self._update_statistics(layer, -1)
         layer.image = image
         layer.partitions = partitions
+        self._update_statistics(layer, 1)
         self.layer_pixels_changed.emit(layer)
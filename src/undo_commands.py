@@ -117,6 +117,19 @@ class UpdateLayerOpacityCommand(UpdateLayerPropertiesCommand):
         super().__init__(state, layer, properties, parent)
         self.setText(f"Opacity: {opacity}")
 
+    def id(self) -> int:
+        return CommandID.OPACITY_COMMAND_ID
+
+    def mergeWith(self, other: QUndoCommand) -> bool:
+        if not isinstance(other, UpdateLayerOpacityCommand):
+            return False
+        if self._layer != other._layer:
+            return False
+        self._new_properties = other._new_properties
+        self.setText(f"Opacity: {self._new_properties.opacity}")
+        self.setObsolete(False)
+        return True
+
 
 class UpdateLayerVisibleCommand(UpdateLayerPropertiesCommand):
     def __init__(self, state, layer: Layer, visible: bool, parent: QUndoCommand | None):
@@ -6,10 +6,13 @@ import unittest
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
 
 from image_utils import (
     _ascii_to_petscii_screencode,
     base64_string_to_qimage,
+    create_icon_from_svg,
+    create_icon_from_theme,
     qimage_to_base64_string,
     rotated_rectangle_dimensions,
 )
@@ -89,6 +92,44 @@ class TestImageUtils(unittest.TestCase):
         self.assertAlmostEqual(w, 106.066, places=3)
         self.assertAlmostEqual(h, 106.066, places=3)
 
+    def test_create_icon_from_svg_is_cached(self):
+        import tempfile
+
+        QApplication.instance() or QApplication([])
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16">'
+            '<rect width="16" height="16" fill="red"/></svg>'
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".svg", delete=False) as tmp:
+            tmp.write(svg)
+        try:
+            icon = create_icon_from_svg(tmp.name, 16)
+            self.assertIsNotNone(icon)
+            self.assertIs(create_icon_from_svg(tmp.name, 16), icon)
+            self.assertIsNot(create_icon_from_svg(tmp.name, 32), icon)
+        finally:
+            os.remove(tmp.name)
+
+        self.assertIsNone(create_icon_from_svg(tmp.name + ".missing.svg"))
+
+    def test_create_icon_from_theme_is_cached(self):
+        QApplication.instance() or QApplication([])
+        icon = create_icon_from_theme("document-open")
+        self.assertIs(create_icon_from_theme("document-open"), icon)
+        self.assertIsNot(create_icon_from_theme("document-save"), icon)
+
+    def test_create_icon_from_theme_uses_bundled_fallback(self):
+        from unittest.mock import patch
+
+        fallback = ":/icons/svg/actions/pixem-test-missing-symbolic.svg"
+        with patch("image_utils.QIcon") as icon_class, patch(
+            "image_utils.QFile.exists", return_value=True
+        ):
+            icon_class.fromTheme.return_value.isNull.return_value = True
+            icon = create_icon_from_theme("pixem-test-missing")
+        icon_class.assert_called_once_with(fallback)
+        self.assertIs(icon, icon_class.return_value)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -87,6 +87,23 @@ class TestLayer(unittest.TestCase):
         self.assertEqual(self.layer.position, QPointF(5.0, 5.0))
         self.assertEqual(self.layer.rotation, 90)
 
+    def test_populate_from_dict_drops_duplicated_partition_names(self):
+        def partition(name, x):
+            return {"name": name, "color": "#ff0000", "route": [{"type": "rect", "x": x, "y": 0}]}
+
+        self.layer.populate_from_dict(
+            {
+                "properties": {"name": "Layer"},
+                "partitions": {
+                    "a": partition("red", 0),
+                    "b": partition("blue", 1),
+                    "c": partition("red", 2),
+                },
+            }
+        )
+        self.assertEqual(list(self.layer.partitions), ["b", "c"])
+        self.assertEqual(self.layer.partitions["c"].route[0].x, 2)
+
     def test_clone(self):
         self.layer.name = "Original"
         clone = self.layer.clone()
@@ -101,6 +101,42 @@ class TestMainWindowOpenFile(unittest.TestCase):
         self.window.state.undo_stack.setClean()
 
 
+class TestMainWindowRecentMenu(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = MainWindow()
+
+    def tearDown(self):
+        self.window.close()
+
+    def test_recent_menu_is_populated_lazily(self):
+        self.assertTrue(self.window._recent_menu_dirty)
+        self.window._recent_menu.aboutToShow.emit()
+        self.assertFalse(self.window._recent_menu_dirty)
+
+        # Showing it again without changes must not rebuild it
+        actions = self.window._recent_menu.actions()
+        self.window._recent_menu.aboutToShow.emit()
+        self.assertEqual(self.window._recent_menu.actions(), actions)
+
+        self.window._invalidate_recent_menu()
+        self.assertTrue(self.window._recent_menu_dirty)
+
+    def test_recent_menu_skips_unchanged_files(self):
+        self.window._recent_menu.aboutToShow.emit()
+        action = self.window._recent_actions[0]
+        action.setText("marker")
+
+        # Same recent files: the actions are not touched
+        self.window._invalidate_recent_menu()
+        self.window._recent_menu.aboutToShow.emit()
+        self.assertFalse(self.window._recent_menu_dirty)
+        self.assertEqual(action.text(), "marker")
+
+
 class TestMainWindowTabs(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -117,6 +153,31 @@ class TestMainWindowTabs(unittest.TestCase):
                 doc.state.undo_stack.setClean()
         self.window.close()
 
+    def test_startup_open_refreshes_docks_once(self):
+        import tempfile
+        from unittest.mock import MagicMock, patch
+
+        from state import State
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = [os.path.join(tmpdir, f"p{i}.pixemproj") for i in range(2)]
+            for filename in filenames:
+                State().save_to_filename(filename)
+            prefs = MagicMock()
+            prefs.get_open_files.return_value = filenames
+            prefs.get_active_file.return_value = filenames[0]
+
+            with (
+                patch("main_window.get_global_preferences", return_value=prefs),
+                patch.object(self.window, "_refresh_docks") as refresh_docks,
+            ):
+                self.window._deferred_startup_open()
+
+            self.assertEqual(self.window._tab_widget.count(), 2)
+            self.assertEqual(self.window._tab_widget.currentIndex(), 0)
+            self.assertIs(self.window._connected_doc, self.window._tab_widget.widget(0))
+            refresh_docks.assert_called_once()
+
     def test_tab_dirty_indicator(self):
         # 1. Create a new project (should have 1 tab "Untitled")
         self.window._on_new_project()
@@ -167,5 +228,346 @@ class TestMainWindowTabs(unittest.TestCase):
                 os.remove(temp_filename)
 
 
+class TestBlockSignals(unittest.TestCase):
+    def test_nested_blocks_restore_previous_state(self):
+        from PySide6.QtCore import QObject
+
+        from main_window import block_signals
+
+        a = QObject()
+        b = QObject()
+        with block_signals((a, b)):
+            with block_signals(a):
+                self.assertTrue(a.signalsBlocked())
+            # Inner block must not unblock the outer one
+            self.assertTrue(a.signalsBlocked())
+            self.assertTrue(b.signalsBlocked())
+        self.assertFalse(a.signalsBlocked())
+        self.assertFalse(b.signalsBlocked())
+
+
+class TestMainWindowPropertyEditor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from PySide6.QtGui import QImage
+
+        from layer import ImageLayer
+
+        self.window = MainWindow()
+        self.window._on_new_project()
+        self.layer = ImageLayer(QImage(10, 10, QImage.Format_ARGB32))
+        self.window.state.add_layer(self.layer)
+        # Run the deferred UI updates, like enabling the actions
+        QApplication.processEvents()
+
+    def tearDown(self):
+        for i in range(self.window._tab_widget.count()):
+            doc = self.window._tab_widget.widget(i)
+            if isinstance(doc, Document):
+                doc.state.undo_stack.setClean()
+        self.window.close()
+
+    def test_connecting_document_twice_does_not_duplicate_slots(self):
+        from PySide6.QtGui import QImage
+
+        from layer import ImageLayer
+
+        self.window._connect_document_signals(self.window.active_document)
+        self.window.state.add_layer(ImageLayer(QImage(10, 10, QImage.Format_ARGB32)))
+        self.assertEqual(self.window._layer_list.count(), 2)
+
+    def test_populate_does_not_push_undo_commands(self):
+        import copy
+
+        properties = copy.deepcopy(self.layer.properties)
+        properties.position = (12.0, 34.0)
+        properties.rotation = 45
+        count = self.window.state.undo_stack.count()
+
+        self.window._populate_property_editor(properties)
+
+        self.assertEqual(self.window.state.undo_stack.count(), count)
+        self.assertEqual(self.window._position_x_spinbox.value(), 12.0)
+        self.assertEqual(self.window._rotation_spinbox.value(), 45)
+        self.assertFalse(self.window._suppress_property_slots)
+
+    def test_rotation_slider_and_spinbox_stay_in_sync(self):
+        self.window._rotation_slider.setValue(30)
+        self.assertEqual(self.window._rotation_spinbox.value(), 30)
+        self.window._rotation_spinbox.setValue(60)
+        self.assertEqual(self.window._rotation_slider.value(), 60)
+        self.window._flush_pending_property_update()
+        self.assertEqual(self.layer.rotation, 60)
+
+    def test_set_editor_position_pushes_one_command(self):
+        count = self.window.state.undo_stack.count()
+        self.window._set_editor_position(5.0, 6.0)
+        self.assertEqual(self.window.state.undo_stack.count(), count + 1)
+        self.assertEqual(self.layer.properties.position, (5.0, 6.0))
+
+    def test_add_layer_populates_partition_list_once(self):
+        from PySide6.QtGui import QImage
+
+        from layer import ImageLayer
+        from partition import Partition
+        from shape import Rect
+
+        layer = ImageLayer(QImage(10, 10, QImage.Format_ARGB32))
+        layer.partitions = {
+            "p1": Partition([Rect(0, 0)], "Red", "#ff0000"),
+            "p2": Partition([Rect(1, 0)], "Green", "#00ff00"),
+        }
+        self.window.state.add_layer(layer)
+
+        self.assertEqual(self.window._partition_list.count(), 2)
+        self.assertEqual(self.window._partition_keys, ["p1", "p2"])
+        self.assertEqual(layer.selected_partition_uuid, "p1")
+
+        self.window._partition_list.setCurrentRow(1)
+        self.assertEqual(layer.selected_partition_uuid, "p2")
+
+        # Repopulating reuses the existing rows
+        first_item = self.window._partition_list.item(0)
+        layer.partitions = {"p2": layer.partitions["p2"]}
+        self.window._populate_partitions(layer)
+        self.assertEqual(self.window._partition_list.count(), 1)
+        self.assertIs(self.window._partition_list.item(0), first_item)
+        self.assertEqual(first_item.text(), "Green")
+        self.assertEqual(self.window._partition_list.currentRow(), 0)
+
+    def test_partition_list_is_populated_when_dock_is_shown(self):
+        from PySide6.QtGui import QImage
+
+        from layer import ImageLayer
+        from partition import Partition
+        from shape import Rect
+
+        self.window.show()
+        self.window._partitions_dock.hide()
+        layer = ImageLayer(QImage(10, 10, QImage.Format_ARGB32))
+        layer.partitions = {"p1": Partition([Rect(0, 0)], "Red", "#ff0000")}
+        self.window.state.add_layer(layer)
+
+        self.assertEqual(self.window._partition_list.count(), 0)
+        self.assertEqual(layer.selected_partition_uuid, "p1")
+
+        self.window._partitions_dock.show()
+        self.assertEqual(self.window._partition_keys, ["p1"])
+        self.assertEqual(self.window._partition_list.currentRow(), 0)
+
+    def test_align_action_moves_layer(self):
+        from layer import LayerAlign
+
+        self.window._set_editor_position(5.0, 5.0)
+        self.window._align_actions[LayerAlign.HORIZONTAL_LEFT].trigger()
+        self.assertEqual(self.layer.position.x(), 0.0)
+        self.assertEqual(self.layer.position.y(), 5.0)
+
+    def test_undo_view_follows_active_document(self):
+        self.window._undo_dock.show()
+        self.assertIs(self.window._undo_view.stack(), self.window.state.undo_stack)
+        self.window.state.undo_stack.setClean()
+        self.window._on_tab_close_requested(self.window._tab_widget.currentIndex())
+        self.assertIsNone(self.window._undo_view.stack())
+        # Don't leave it visible in the saved window state
+        self.window._undo_dock.hide()
+
+    def test_removing_unknown_layer_keeps_layer_list(self):
+        from PySide6.QtGui import QImage
+
+        from layer import ImageLayer
+
+        unknown = ImageLayer(QImage(10, 10, QImage.Format_ARGB32))
+        with self.assertLogs("main_window", level="WARNING"):
+            self.window._on_state_layer_removed(unknown)
+        self.assertEqual(self.window._layer_list.count(), 1)
+
+    def test_slider_release_applies_pending_update(self):
+        self.window._opacity_slider.setValue(50)
+        self.assertEqual(self.layer.opacity, 1.0)
+        self.window._opacity_slider.sliderReleased.emit()
+        self.assertEqual(self.layer.opacity, 0.5)
+
+    def test_canvas_relayout_is_coalesced(self):
+        from unittest.mock import patch
+
+        canvas = self.window.canvas
+        with patch.object(canvas, "recalculate_fixed_size") as recalculate:
+            for _ in range(3):
+                self.window._schedule_canvas_relayout()
+            recalculate.assert_not_called()
+            QApplication.processEvents()
+            recalculate.assert_called_once()
+
+    def test_reselecting_same_partition_does_not_repaint(self):
+        from unittest.mock import patch
+
+        self.assertIsNone(self.layer.selected_partition_uuid)
+        with patch.object(self.window.canvas, "update") as update:
+            self.window._on_partition_current_item_changed(None, None)
+            update.assert_not_called()
+
+    def test_cancelled_png_export_does_not_render(self):
+        from unittest.mock import patch
+
+        with (
+            patch.object(self.window, "_get_save_filename", return_value=""),
+            patch.object(self.window.canvas, "render_to_qimage") as render,
+        ):
+            self.window._on_export_to_png_as()
+            render.assert_not_called()
+
+    def test_png_export_is_written_in_background(self):
+        import tempfile
+        from unittest.mock import patch
+
+        from PySide6.QtCore import QThreadPool
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "export")
+            with patch.object(self.window, "_get_save_filename", return_value=filename):
+                self.window._on_export_to_png_as()
+            self.assertEqual(len(self.window._active_workers), 1)
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.processEvents()
+            self.assertEqual(len(self.window._active_workers), 0)
+            self.assertTrue(os.path.exists(filename + ".png"))
+
+    def test_export_project_checks_file_in_background(self):
+        import tempfile
+        from unittest.mock import patch
+
+        from PySide6.QtCore import QThreadPool
+
+        state = self.window.state
+        with tempfile.NamedTemporaryFile(suffix=".svg") as tmp:
+            state.properties.export_filename = tmp.name
+            with patch.object(state, "export_to_svg") as export_to_svg:
+                self.window._on_export_project()
+                QThreadPool.globalInstance().waitForDone()
+                QApplication.processEvents()
+                export_to_svg.assert_called_once_with(tmp.name)
+
+    def test_save_project_in_background(self):
+        import tempfile
+
+        from PySide6.QtCore import QThreadPool
+
+        state = self.window.state
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "project.pixemproj")
+            state.mark_saved(filename, -1)
+            self.window._on_save_project()
+            self.window._update_qactions()
+            self.assertFalse(self.window._save_action.isEnabled())
+
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.processEvents()
+            # The actions are updated in the next event loop iteration
+            QApplication.processEvents()
+            self.assertTrue(os.path.exists(filename))
+            self.assertTrue(state.undo_stack.isClean())
+            self.assertTrue(self.window._save_action.isEnabled())
+
+    def test_qactions_update_is_coalesced(self):
+        from unittest.mock import patch
+
+        QApplication.processEvents()
+        with patch.object(self.window, "_update_qactions") as update_qactions:
+            self.window.state.layer_property_changed.emit(self.layer)
+            self.window._schedule_update_qactions()
+            self.window._schedule_update_qactions()
+            update_qactions.assert_not_called()
+            QApplication.processEvents()
+            update_qactions.assert_called_once()
+
+    def test_statusbar_only_updated_when_stats_change(self):
+        from unittest.mock import patch
+
+        self.window._update_statusbar()
+        text = self.window._total_partitions_label.text()
+        self.assertTrue(text.endswith(str(len(self.layer.partitions))))
+        with patch.object(self.window._total_partitions_label, "setText") as set_text:
+            self.window._update_statusbar()
+            set_text.assert_not_called()
+
+    def test_statusbar_update_is_coalesced(self):
+        from unittest.mock import patch
+
+        QApplication.processEvents()
+        with patch.object(self.window, "_update_statusbar") as update_statusbar:
+            for _ in range(3):
+                self.window._schedule_update_statusbar()
+            update_statusbar.assert_not_called()
+            QApplication.processEvents()
+            update_statusbar.assert_called_once()
+
+    def test_show_hoop_action_updates_preferences(self):
+        from preferences import get_global_preferences
+
+        prefs = get_global_preferences()
+        visible = prefs.get_hoop_visible()
+        self.window._show_hoop_action.trigger()
+        self.assertEqual(prefs.get_hoop_visible(), not visible)
+        self.window._show_hoop_action.trigger()
+        self.assertEqual(prefs.get_hoop_visible(), visible)
+
+    def test_zoom_without_change_does_not_resize_canvas(self):
+        from unittest.mock import patch
+
+        canvas = self.window.canvas
+        undo_count = self.window.state.undo_stack.count()
+        with patch.object(canvas, "recalculate_fixed_size") as recalculate:
+            canvas.zoom_reset()
+            recalculate.assert_not_called()
+            canvas.zoom_in()
+            recalculate.assert_called_once()
+        self.assertEqual(self.window.state.undo_stack.count(), undo_count + 1)
+
+    def test_editing_spinbox_updates_layer(self):
+        self.window._position_x_spinbox.setValue(7.0)
+        self.window._flush_pending_property_update()
+        self.assertEqual(self.layer.position.x(), 7.0)
+
+    def test_unchanged_layer_properties_skip_editor_refresh(self):
+        from unittest.mock import patch
+
+        with patch.object(self.window, "_populate_property_editor") as populate:
+            self.window.state.layer_property_changed.emit(self.layer)
+            populate.assert_not_called()
+
+        self.window._position_x_spinbox.setValue(7.0)
+        self.window._flush_pending_property_update()
+        self.window.state.undo_stack.undo()
+        self.assertEqual(self.window._position_x_spinbox.value(), 0.0)
+
+    def test_spinbox_changes_are_coalesced(self):
+        undo_stack = self.window.state.undo_stack
+        count = undo_stack.count()
+        for value in (1.0, 2.0, 3.0, 4.0):
+            self.window._position_x_spinbox.setValue(value)
+        self.assertEqual(undo_stack.count(), count)
+        self.window._flush_pending_property_update()
+        self.assertEqual(undo_stack.count(), count + 1)
+        self.assertEqual(self.layer.position.x(), 4.0)
+
+    def test_slider_back_to_start_is_a_no_op(self):
+        from unittest.mock import patch
+
+        self.window._opacity_slider.setValue(50)
+        self.window._flush_pending_property_update()
+        undo_stack = self.window.state.undo_stack
+        count = undo_stack.count()
+        with patch.object(self.window, "_schedule_canvas_relayout") as relayout:
+            self.window._opacity_slider.setValue(100)
+            self.window._opacity_slider.setValue(50)
+            self.window._flush_pending_property_update()
+            relayout.assert_not_called()
+        self.assertEqual(undo_stack.count(), count)
+
+
 if __name__ == "__main__":
     unittest.main()
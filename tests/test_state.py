@@ -98,6 +98,68 @@ class TestState(unittest.TestCase):
         self.state.reorder_layers([layer2, layer1])
         self.assertEqual(self.state.layers, [layer2, layer1])
 
+    def test_next_layer_number(self):
+        self.assertEqual(self.state.next_layer_number(), 1)
+        self.state.add_layer(self.layer)
+        self.assertEqual(self.state.next_layer_number(), 2)
+        # Deleting a layer must not make the numbers go back
+        self.state.delete_layer(self.layer)
+        self.assertEqual(self.state.next_layer_number(), 3)
+
+        # Loaded projects continue after the existing layers
+        self.state.add_layer(self.layer)
+        new_state = State.from_dict(self.state.to_dict())
+        self.assertEqual(new_state.next_layer_number(), 2)
+
+    def test_get_layer_index(self):
+        other = Layer(QImage(10, 10, QImage.Format_ARGB32))
+        self.assertEqual(self.state.get_layer_index(self.layer.uuid), -1)
+        self.state.add_layer(self.layer)
+        self.state.add_layer(other)
+        self.assertEqual(self.state.get_layer_index(self.layer.uuid), 0)
+        self.assertEqual(self.state.get_layer_index(other.uuid), 1)
+
+        self.state.reorder_layers([other, self.layer])
+        self.assertEqual(self.state.get_layer_index(other.uuid), 0)
+        self.assertEqual(self.state.get_layer_index(self.layer.uuid), 1)
+
+        self.state.delete_layer(other)
+        self.assertEqual(self.state.get_layer_index(self.layer.uuid), 0)
+        self.assertEqual(self.state.get_layer_index(other.uuid), -1)
+
+    def test_statistics(self):
+        self.layer.partitions = {
+            "p1": Partition([Rect(0, 0), Rect(1, 0)], "P1", "#FF0000"),
+            "p2": Partition([Rect(2, 0)], "P2", "#FF0000"),
+        }
+        other = Layer(QImage(10, 10, QImage.Format_ARGB32))
+        other.partitions = {"p3": Partition([Rect(0, 0)], "P3", "#00FF00")}
+        self.assertEqual(self.state.statistics, (0, 0, 0))
+
+        self.state.add_layer(self.layer)
+        self.state.add_layer(other)
+        self.assertEqual(self.state.statistics, (2, 3, 4))
+
+        self.state.update_partition_route(self.layer, self.layer.partitions["p2"], [])
+        self.assertEqual(self.state.statistics, (2, 3, 3))
+
+        self.state.delete_partition(self.layer, self.layer.partitions["p1"])
+        self.assertEqual(self.state.statistics, (2, 2, 1))
+
+        self.state.delete_layer(other)
+        self.assertEqual(self.state.statistics, (1, 1, 0))
+
+        # Undo everything
+        for _ in range(3):
+            self.state.undo_stack.undo()
+        self.assertEqual(self.state.statistics, (2, 3, 4))
+        self.assertEqual(State.from_dict(self.state.to_dict()).statistics, (2, 3, 4))
+
+    def test_project_basename(self):
+        self.assertIsNone(self.state.project_basename)
+        self.state.mark_saved(os.path.join("some", "dir", "project.pixemproj"), -1)
+        self.assertEqual(self.state.project_basename, "project.pixemproj")
+
     def test_basic_serialization(self):
         self.state.add_layer(self.layer)
         self.state.hoop_visible = False
@@ -1,3 +1,4 @@
+import copy
 import os
 import sys
 import unittest
@@ -81,6 +82,21 @@ class TestUndoCommands(unittest.TestCase):
         cmd.redo()
         self.assertEqual(self.layer.name, "Renamed Layer")
 
+    def test_opacity_commands_are_merged(self):
+        self.state.add_layer(self.layer)
+        undo_stack = self.state.undo_stack
+        count = undo_stack.count()
+
+        for opacity in (0.9, 0.8, 0.7):
+            props = copy.deepcopy(self.layer.properties)
+            props.opacity = opacity
+            self.state.set_layer_properties(self.layer, props)
+
+        self.assertEqual(undo_stack.count(), count + 1)
+        self.assertEqual(self.layer.opacity, 0.7)
+        undo_stack.undo()
+        self.assertEqual(self.layer.opacity, 1.0)
+
     def test_update_layer_image_command(self):
         self.state.add_layer(self.layer)
 